@@ -0,0 +1,31 @@
+# core/_entry_prep.py
+# 항목별 타임코드 파생값 사전 계산 (EDL, FCPXML, OverlapChecker 공용)
+
+import os
+from typing import List, NamedTuple
+from .srt_parser import SRTEntry
+from ..utils.timecode import ms_to_frames, ms_to_timecode
+
+
+class PreparedEntry(NamedTuple):
+    """타임코드 파생값이 계산된 항목"""
+    entry: SRTEntry
+    tc_filename: str
+    start_frames: int
+    tc_in: str
+
+
+def prepare_entries(entries: List[SRTEntry], fps: float) -> List[PreparedEntry]:
+    """항목별 파일명 타임코드 / 시작 프레임 / 시작 타임코드를 한 번에 계산"""
+    prepared = []
+    for entry in entries:
+        tc_in = ms_to_timecode(entry.start_ms, fps)
+        prepared.append(PreparedEntry(
+            entry, tc_in.replace(':', '_'), ms_to_frames(entry.start_ms, fps), tc_in
+        ))
+    return prepared
+
+
+def wav_paths(wav_folder: str, prepared: List[PreparedEntry]) -> List[str]:
+    """항목별 WAV 경로 리스트 ({wav_folder}/{tc_filename}.wav)"""
+    return [os.path.join(wav_folder, f"{p.tc_filename}.wav") for p in prepared]
@@ -0,0 +1,78 @@
+# core/_https_pool.py
+# CLOVA API용 keep-alive HTTPS 연결과 요청 간격 제한 (CLOVAEngine, 레거시 TTSEngine 공용)
+
+import ssl
+import time
+import threading
+import http.client
+import urllib.parse
+
+# CLOVA 요청 전용 SSL 컨텍스트 - 인증서 검증 생략 (macOS 호환성)
+# 전역 기본값을 바꾸지 않으므로 다른 HTTPS 사용처에는 영향 없음
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# 스레드별 keep-alive 연결 (호스트 -> HTTPSConnection)
+_connections = threading.local()
+
+# 일시적 오류로 보고 재시도할 HTTP 상태 (요청 한도 초과, 서버 오류)
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3  # 초 (재시도마다 두 배)
+
+
+class RequestThrottle:
+    """여러 작업 스레드가 보내는 요청의 시작 간격 제한"""
+
+    __slots__ = ('_lock', '_next_at')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self, interval: float):
+        """직전 요청 시작 후 interval초가 지날 때까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def post_form(url: str, headers: dict, body: bytes, timeout: float) -> http.client.HTTPResponse:
+    """재사용 연결로 POST 요청 후 응답 반환
+
+    응답 본문은 호출 측에서 끝까지 읽어야 다음 요청에 연결을 재사용할 수 있다.
+    서버가 유휴 연결을 끊었거나 이전 응답을 다 읽지 못한 연결이면
+    새 연결로 한 번 재시도한다.
+    """
+    parts = urllib.parse.urlsplit(url)
+    pool = getattr(_connections, 'pool', None)
+    if pool is None:
+        pool = _connections.pool = {}
+
+    for attempt in range(2):
+        conn = pool.get(parts.netloc)
+        if conn is None:
+            conn = pool[parts.netloc] = http.client.HTTPSConnection(
+                parts.netloc, timeout=timeout, context=SSL_CONTEXT)
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+
+        try:
+            conn.request("POST", parts.path, body=body, headers=headers)
+            return conn.getresponse()
+        except (http.client.RemoteDisconnected, http.client.ImproperConnectionState,
+                ConnectionResetError, BrokenPipeError):
+            conn.close()
+            del pool[parts.netloc]
+            if attempt:
+                raise
+        except Exception:
+            conn.close()
+            del pool[parts.netloc]
+            raise
@@ -0,0 +1,99 @@
+# core/_wav_cache.py
+# WAV 존재 여부 / 길이 / 샘플레이트 캐시 (EDL, FCPXML, OverlapChecker 공용)
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
+from . import _wav_meta_cache
+from ..utils.audio import read_wav_header
+
+# 파일이 없을 때 반환값 (존재 여부, 길이(ms), 샘플레이트)
+_MISSING = (False, 0, 48000)
+
+# 헤더 병렬 읽기 설정 (네트워크 드라이브에서 왕복 지연을 겹치기 위함)
+_MAX_WORKERS = 16
+_PARALLEL_MIN = 8
+
+# 절대경로 -> (mtime_ns, size, (exists, duration_ms, sample_rate))
+_cache: Dict[str, Tuple[int, int, Tuple[bool, int, int]]] = {}
+
+
+def get_wav_info(wav_path: str) -> Tuple[bool, int, int]:
+    """WAV 파일의 (존재 여부, 길이(밀리초), 샘플레이트) 반환
+
+    os.stat 한 번으로 존재 여부를 확인하고, mtime/크기가 바뀌지 않았다면
+    이전에 읽은 헤더 정보(메모리 → 디스크 캐시 순)를 그대로 재사용한다.
+    """
+    key = os.path.abspath(wav_path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _cache.pop(key, None)
+        return _MISSING
+
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    folder, name = os.path.split(key)
+    meta = _wav_meta_cache.get(folder, name, st)
+    if meta is not None:
+        info = (True, meta[0], meta[1])
+    else:
+        try:
+            rate, _, _, frames = read_wav_header(key)
+            info = (True, int((frames / rate) * 1000), rate)
+            _wav_meta_cache.put(folder, name, st, info[1], rate)
+        except Exception:
+            info = (True, 0, 48000)
+
+    _cache[key] = (st.st_mtime_ns, st.st_size, info)
+    return info
+
+
+def get_wav_infos(paths: List[str], available: Set[str]) -> List[Tuple[bool, int, int]]:
+    """여러 WAV의 get_wav_info 결과를 순서대로 반환
+
+    파일명이 available(scan_wav_folder 결과)에 없으면 바로 '없음'으로 처리하고,
+    나머지는 스레드 풀에서 동시에 헤더를 읽는다. 대소문자 구분 없는
+    파일시스템(macOS 등)을 위해 비교는 casefold 이름으로 하며,
+    실제 존재 여부는 get_wav_info의 os.stat이 최종 판단한다.
+    """
+    infos = [_MISSING] * len(paths)
+    todo = [(i, p) for i, p in enumerate(paths) if os.path.basename(p).casefold() in available]
+    if not todo:
+        return infos
+
+    # 디스크 캐시는 메인 스레드에서 미리 로드 (스레드 간 중복 로드 방지)
+    for folder in {os.path.dirname(os.path.abspath(p)) for _, p in todo}:
+        _wav_meta_cache.load(folder)
+
+    todo_paths = [p for _, p in todo]
+    if len(todo) < _PARALLEL_MIN:
+        results = map(get_wav_info, todo_paths)
+    else:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+            results = list(ex.map(get_wav_info, todo_paths))
+
+    for (i, _), info in zip(todo, results):
+        infos[i] = info
+    return infos
+
+
+def clear_wav_cache():
+    """캐시 전체 비우기"""
+    _cache.clear()
+
+
+def save_wav_cache(wav_folder: str):
+    """폴더의 WAV 정보 디스크 캐시 기록 (설정 폴더 아래)"""
+    _wav_meta_cache.save(wav_folder)
+
+
+def scan_wav_folder(wav_folder: str) -> Set[str]:
+    """폴더 내 파일명(casefold) 집합 반환 (디렉터리 한 번 읽기로 개별 exists 검사 대체)"""
+    try:
+        with os.scandir(wav_folder) as it:
+            return {e.name.casefold() for e in it if e.is_file()}
+    except OSError:
+        return set()
@@ -0,0 +1,89 @@
+# core/_wav_meta_cache.py
+# WAV 길이/샘플레이트 디스크 캐시 (폴더별 JSON)
+#
+# 같은 WAV 폴더로 내보내기를 반복할 때 헤더를 다시 읽지 않도록
+# {파일명: [mtime_ns, size, duration_ms, sample_rate]} 를 저장한다.
+# 납품용 WAV 폴더에는 아무것도 쓰지 않고 ~/.tomato_ad/wav_cache/ 아래에 저장한다.
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+from ..utils.config import config
+
+CACHE_VERSION = 1
+
+# 폴더(절대경로) -> {파일명: [mtime_ns, size, duration_ms, sample_rate]}
+_folders: Dict[str, Dict[str, list]] = {}
+_dirty: Set[str] = set()
+
+
+def _cache_path(folder: str) -> Path:
+    """폴더별 캐시 파일 경로 (설정 폴더 아래)"""
+    digest = hashlib.sha1(folder.encode('utf-8')).hexdigest()
+    return Path(config.config_dir) / 'wav_cache' / f"{digest}.json"
+
+
+def _is_valid_item(item) -> bool:
+    """[mtime_ns, size, duration_ms, sample_rate] 형식인지 확인"""
+    return (
+        isinstance(item, list) and len(item) == 4
+        and all(isinstance(v, int) and not isinstance(v, bool) for v in item)
+    )
+
+
+def load(folder: str) -> Dict[str, list]:
+    """폴더 캐시 로드 (프로세스당 한 번)"""
+    folder = os.path.abspath(folder)
+    files = _folders.get(folder)
+    if files is not None:
+        return files
+
+    files = {}
+    try:
+        with open(_cache_path(folder), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        loaded = data.get('files') if data.get('version') == CACHE_VERSION else None
+        # 형식이 맞지 않는 캐시는 빈 캐시로 취급
+        if isinstance(loaded, dict):
+            files = {k: v for k, v in loaded.items() if _is_valid_item(v)}
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    _folders[folder] = files
+    return files
+
+
+def get(folder: str, name: str, st: os.stat_result) -> Optional[Tuple[int, int]]:
+    """(duration_ms, sample_rate) 반환 - mtime/크기가 다르면 None"""
+    item = load(folder).get(name)
+    if item and item[0] == st.st_mtime_ns and item[1] == st.st_size:
+        return item[2], item[3]
+    return None
+
+
+def put(folder: str, name: str, st: os.stat_result, duration_ms: int, sample_rate: int):
+    """항목 갱신 (save() 호출 시 기록)"""
+    folder = os.path.abspath(folder)
+    load(folder)[name] = [st.st_mtime_ns, st.st_size, duration_ms, sample_rate]
+    _dirty.add(folder)
+
+
+def save(folder: str):
+    """변경된 폴더 캐시를 디스크에 기록"""
+    folder = os.path.abspath(folder)
+    if folder not in _dirty:
+        return
+
+    payload = json.dumps({'version': CACHE_VERSION, 'files': _folders.get(folder, {})})
+    path = _cache_path(folder)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        _dirty.discard(folder)
+    except OSError:
+        pass
@@ -3,8 +3,9 @@
 
 import os
 from typing import List
-from ...utils.audio import get_wav_duration_ms
-from ...utils.timecode import ms_to_filename_tc, ms_to_timecode
+from .._wav_cache import get_wav_infos, save_wav_cache, scan_wav_folder
+from .._entry_prep import prepare_entries, wav_paths
+from ...utils.timecode import ms_to_timecode
 
 
 class EDLExporter:
@@ -25,40 +26,42 @@ class EDLExporter:
             성공 여부
         """
         wav_folder_abs = os.path.abspath(wav_folder)
+        available = scan_wav_folder(wav_folder)
+        prepared = prepare_entries(entries, self.fps)
+        paths_abs = wav_paths(wav_folder_abs, prepared)
+        infos = get_wav_infos(paths_abs, available)
         
+        # EDL 내용 생성 (파일 쓰기와 분리)
+        parts = ["TITLE: AD_TTS_IMPORT\n", "FCM: NON-DROP FRAME\n\n"]
+        
+        edit_num = 1
+        for (entry, tc_filename, _, tc_in), wav_path_abs, info in zip(prepared, paths_abs, infos):
+            exists, tts_duration, _ = info
+            if exists:
+                tc_out = ms_to_timecode(entry.start_ms + tts_duration, self.fps)
+                src_out = ms_to_timecode(tts_duration, self.fps)
+                
+                # 릴 이름 (8자 제한)
+                reel_name = f"AD{edit_num:04d}"
+                
+                # EDL 라인
+                parts.append(f"{edit_num:03d}  {reel_name}  AA     C        ")
+                parts.append(f"00:00:00:00 {src_out} {tc_in} {tc_out}\n")
+                
+                # 클립 정보 주석
+                parts.append(f"* FROM CLIP NAME: {tc_filename}.wav\n")
+                parts.append(f"* SOURCE FILE: {wav_path_abs}\n")
+                parts.append("* AUDIO LEVEL AT 00:00:00:00 IS 0.00 DB\n")
+                parts.append("\n")
+                
+                edit_num += 1
+        
+        save_wav_cache(wav_folder)
+        
+        # 파일 저장
         try:
             with open(output_path, 'w') as f:
-                f.write("TITLE: AD_TTS_IMPORT\n")
-                f.write("FCM: NON-DROP FRAME\n\n")
-                
-                edit_num = 1
-                for entry in entries:
-                    tc_filename = ms_to_filename_tc(entry.start_ms, self.fps)
-                    wav_path = os.path.join(wav_folder, f"{tc_filename}.wav")
-                    wav_path_abs = os.path.join(wav_folder_abs, f"{tc_filename}.wav")
-                    
-                    if os.path.exists(wav_path):
-                        tts_duration = get_wav_duration_ms(wav_path)
-                        
-                        tc_in = ms_to_timecode(entry.start_ms, self.fps)
-                        tc_out = ms_to_timecode(entry.start_ms + tts_duration, self.fps)
-                        src_out = ms_to_timecode(tts_duration, self.fps)
-                        
-                        # 릴 이름 (8자 제한)
-                        reel_name = f"AD{edit_num:04d}"
-                        
-                        # EDL 라인
-                        f.write(f"{edit_num:03d}  {reel_name}  AA     C        ")
-                        f.write(f"00:00:00:00 {src_out} {tc_in} {tc_out}\n")
-                        
-                        # 클립 정보 주석
-                        f.write(f"* FROM CLIP NAME: {tc_filename}.wav\n")
-                        f.write(f"* SOURCE FILE: {wav_path_abs}\n")
-                        f.write(f"* AUDIO LEVEL AT 00:00:00:00 IS 0.00 DB\n")
-                        f.write("\n")
-                        
-                        edit_num += 1
-            
+                f.write(''.join(parts))
             return True
-        except Exception:
+        except OSError:
             return False
@@ -2,9 +2,10 @@
 # FCPXML 파일 생성 (DaVinci Resolve 호환)
 
 import os
-from typing import List
-from ...utils.audio import get_wav_duration_ms, get_wav_sample_rate
-from ...utils.timecode import ms_to_filename_tc, ms_to_frames
+import xml.etree.ElementTree as ET
+from .._wav_cache import get_wav_infos, save_wav_cache, scan_wav_folder
+from .._entry_prep import prepare_entries, wav_paths
+from ...utils.timecode import ms_to_frames
 
 
 class FCPXMLExporter:
@@ -25,22 +26,20 @@ class FCPXMLExporter:
             성공 여부
         """
         wav_folder_abs = os.path.abspath(wav_folder)
+        available = scan_wav_folder(wav_folder)
+        prepared = prepare_entries(entries, self.fps)
+        paths_abs = wav_paths(wav_folder_abs, prepared)
+        infos = get_wav_infos(paths_abs, available)
         
         # 클립 데이터 수집
         clips_data = []
         max_end_frame = 0
         
-        for entry in entries:
-            tc_filename = ms_to_filename_tc(entry.start_ms, self.fps)
-            wav_path = os.path.join(wav_folder, f"{tc_filename}.wav")
-            wav_path_abs = os.path.join(wav_folder_abs, f"{tc_filename}.wav")
-            
-            if os.path.exists(wav_path):
-                duration_ms = get_wav_duration_ms(wav_path)
+        for (entry, tc_filename, start_frames, _), wav_path_abs, info in zip(prepared, paths_abs, infos):
+            exists, duration_ms, sample_rate = info
+            if exists:
                 duration_frames = ms_to_frames(duration_ms, self.fps)
-                start_frames = ms_to_frames(entry.start_ms, self.fps)
                 end_frames = start_frames + duration_frames
-                sample_rate = get_wav_sample_rate(wav_path)
                 
                 if end_frames > max_end_frame:
                     max_end_frame = end_frames
@@ -54,6 +53,8 @@ class FCPXMLExporter:
                     'sample_rate': sample_rate
                 })
         
+        save_wav_cache(wav_folder)
+        
         if not clips_data:
             return False
         
@@ -61,50 +62,72 @@ class FCPXMLExporter:
         timeline_duration = max_end_frame + int(self.fps * 10)
         fps_int = int(self.fps)
         
-        # FCPXML 생성
-        xml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE fcpxml>
-<fcpxml version="1.9">
-    <resources>
-        <format id="r1" name="FFVideoFormat1080p{fps_int}" frameDuration="1/{fps_int}s" width="1920" height="1080"/>
-'''
+        # FCPXML 생성 (ElementTree - 속성 이스케이프는 직렬화기가 처리)
+        root = ET.Element('fcpxml', version='1.9')
+        resources = ET.SubElement(root, 'resources')
+        ET.SubElement(resources, 'format', {
+            'id': 'r1',
+            'name': f"FFVideoFormat1080p{fps_int}",
+            'frameDuration': f"1/{fps_int}s",
+            'width': '1920',
+            'height': '1080',
+        })
         
-        # 오디오 리소스 추가
-        for i, clip in enumerate(clips_data):
-            audio_samples = int(clip['duration_ms'] * clip['sample_rate'] / 1000)
-            filepath_escaped = clip['filepath'].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            xml_content += f'''        <asset id="r{i+2}" name="{clip['filename']}" src="file://{filepath_escaped}" start="0s" duration="{audio_samples}/{clip['sample_rate']}s" hasAudio="1" audioSources="1" audioChannels="1" audioRate="{clip['sample_rate']}"/>
-'''
+        library = ET.SubElement(root, 'library')
+        event = ET.SubElement(library, 'event', name='AD_TTS_Import')
+        project = ET.SubElement(event, 'project', name='AD_Timeline')
+        sequence = ET.SubElement(project, 'sequence', {
+            'format': 'r1',
+            'duration': f"{timeline_duration}/{fps_int}s",
+            'tcStart': f"0/{fps_int}s",
+            'tcFormat': 'NDF',
+            'audioLayout': 'stereo',
+            'audioRate': '48k',
+        })
+        spine = ET.SubElement(sequence, 'spine')
+        gap = ET.SubElement(spine, 'gap', {
+            'name': 'Gap',
+            'offset': f"0/{fps_int}s",
+            'duration': f"{timeline_duration}/{fps_int}s",
+            'start': f"0/{fps_int}s",
+        })
         
-        xml_content += f'''    </resources>
-    <library>
-        <event name="AD_TTS_Import">
-            <project name="AD_Timeline">
-                <sequence format="r1" duration="{timeline_duration}/{fps_int}s" tcStart="0/{fps_int}s" tcFormat="NDF" audioLayout="stereo" audioRate="48k">
-                    <spine>
-                        <gap name="Gap" offset="0/{fps_int}s" duration="{timeline_duration}/{fps_int}s" start="0/{fps_int}s">
-'''
-        
-        # 오디오 클립 배치
         for i, clip in enumerate(clips_data):
             audio_samples = int(clip['duration_ms'] * clip['sample_rate'] / 1000)
-            xml_content += f'''                            <audio name="{clip['filename']}" ref="r{i+2}" lane="1" offset="{clip['start_frames']}/{fps_int}s" duration="{audio_samples}/{clip['sample_rate']}s" start="0s"/>
-'''
+            duration = f"{audio_samples}/{clip['sample_rate']}s"
+            
+            # 오디오 리소스
+            ET.SubElement(resources, 'asset', {
+                'id': f"r{i+2}",
+                'name': clip['filename'],
+                'src': f"file://{clip['filepath']}",
+                'start': '0s',
+                'duration': duration,
+                'hasAudio': '1',
+                'audioSources': '1',
+                'audioChannels': '1',
+                'audioRate': str(clip['sample_rate']),
+            })
+            
+            # 오디오 클립 배치
+            ET.SubElement(gap, 'audio', {
+                'name': clip['filename'],
+                'ref': f"r{i+2}",
+                'lane': '1',
+                'offset': f"{clip['start_frames']}/{fps_int}s",
+                'duration': duration,
+                'start': '0s',
+            })
         
-        xml_content += '''                        </gap>
-                    </spine>
-                </sequence>
-            </project>
-        </event>
-    </library>
-</fcpxml>
-'''
+        ET.indent(root, space='    ')
         
         # 파일 저장
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n<!DOCTYPE fcpxml>\n')
+                ET.ElementTree(root).write(f, encoding='unicode')
+                f.write('\n')
             return True
-        except Exception:
+        except OSError:
             return False
@@ -1,14 +1,13 @@
 # core/overlap_checker.py
 # AD 분량 오버랩 검사
 
-import os
 from dataclasses import dataclass
-from typing import List, Optional
-from ..utils.audio import get_wav_duration_ms
-from ..utils.timecode import ms_to_timecode, ms_to_filename_tc
+from typing import Iterator, List, Optional
+from ._wav_cache import get_wav_infos, save_wav_cache, scan_wav_folder
+from ._entry_prep import prepare_entries, wav_paths
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlapResult:
     """오버랩 검사 결과"""
     index: int
@@ -49,6 +48,9 @@ class OverlapChecker:
         self.results: List[OverlapResult] = []
         self.issues: List[OverlapResult] = []
         self.voice_settings: Optional[dict] = None
+        # check() 중에 집계되는 요약 값
+        self._counts = {'OK': 0, 'OVER': 0, 'MISSING': 0}
+        self._total_over_ms = 0
 
     def set_voice_settings(self, settings: dict):
         """음성 설정 저장"""
@@ -66,58 +68,52 @@ class OverlapChecker:
         """
         self.results = []
         self.issues = []
+        self._counts = {'OK': 0, 'OVER': 0, 'MISSING': 0}
+        self._total_over_ms = 0
+        available = scan_wav_folder(wav_folder)
+        prepared = prepare_entries(entries, self.fps)
+        paths = wav_paths(wav_folder, prepared)
+        infos = get_wav_infos(paths, available)
         
-        for entry in entries:
-            tc_filename = ms_to_filename_tc(entry.start_ms, self.fps)
-            wav_path = os.path.join(wav_folder, f"{tc_filename}.wav")
+        for (entry, _, _, tc_in), wav_path, info in zip(prepared, paths, infos):
+            exists, tts_duration, _ = info
+            available_duration = entry.duration_ms
             
-            if os.path.exists(wav_path):
-                tts_duration = get_wav_duration_ms(wav_path)
-                available_duration = entry.duration_ms
+            if exists:
                 diff = tts_duration - available_duration
-                
-                if diff > 0:
-                    status = 'OVER'
-                else:
-                    status = 'OK'
-                
-                result = OverlapResult(
-                    index=entry.index,
-                    timecode=ms_to_timecode(entry.start_ms, self.fps),
-                    text=entry.text[:50] + '...' if len(entry.text) > 50 else entry.text,
-                    tts_duration_ms=tts_duration,
-                    available_duration_ms=available_duration,
-                    diff_ms=diff,
-                    status=status,
-                    wav_path=wav_path
-                )
+                status = 'OVER' if diff > 0 else 'OK'
             else:
-                result = OverlapResult(
-                    index=entry.index,
-                    timecode=ms_to_timecode(entry.start_ms, self.fps),
-                    text=entry.text[:50] + '...' if len(entry.text) > 50 else entry.text,
-                    tts_duration_ms=0,
-                    available_duration_ms=entry.duration_ms,
-                    diff_ms=0,
-                    status='MISSING',
-                    wav_path=None
-                )
+                tts_duration = diff = 0
+                status = 'MISSING'
+            
+            result = OverlapResult(
+                index=entry.index,
+                timecode=tc_in,
+                text=entry.text[:50] + '...' if len(entry.text) > 50 else entry.text,
+                tts_duration_ms=tts_duration,
+                available_duration_ms=available_duration,
+                diff_ms=diff,
+                status=status,
+                wav_path=wav_path if exists else None
+            )
             
             self.results.append(result)
+            self._counts[result.status] += 1
             
             if result.is_over:
                 self.issues.append(result)
+                self._total_over_ms += result.diff_ms
         
+        save_wav_cache(wav_folder)
         return self.results
     
     def get_summary(self) -> dict:
         """검사 요약 반환"""
         total = len(self.results)
-        ok_count = sum(1 for r in self.results if r.status == 'OK')
-        over_count = sum(1 for r in self.results if r.status == 'OVER')
-        missing_count = sum(1 for r in self.results if r.status == 'MISSING')
-        
-        total_over_ms = sum(r.diff_ms for r in self.results if r.is_over)
+        ok_count = self._counts['OK']
+        over_count = self._counts['OVER']
+        missing_count = self._counts['MISSING']
+        total_over_ms = self._total_over_ms
         
         return {
             'total': total,
@@ -130,57 +126,58 @@ class OverlapChecker:
     
     def generate_report(self) -> str:
         """텍스트 리포트 생성"""
+        return "\n".join(self._iter_report_lines())
+    
+    def _iter_report_lines(self) -> Iterator[str]:
+        """리포트 라인 순차 생성"""
         summary = self.get_summary()
 
-        lines = [
-            "=" * 50,
-            "AD TTS 분량 검사 리포트",
-            "=" * 50,
-            "",
-        ]
+        yield "=" * 50
+        yield "AD TTS 분량 검사 리포트"
+        yield "=" * 50
+        yield ""
 
         # 음성 설정 정보 추가
         if self.voice_settings:
-            lines.append("[음성 설정]")
-            lines.append(f"  화자: {self.voice_settings.get('speaker', '-')}")
-            lines.append(f"  속도: {self.voice_settings.get('speed', '-')}")
-            lines.append(f"  볼륨: {self.voice_settings.get('volume', '-')}")
-            lines.append(f"  피치: {self.voice_settings.get('pitch', '-')}")
-            lines.append(f"  알파: {self.voice_settings.get('alpha', '-')}")
-            lines.append("")
-            lines.append("-" * 50)
-            lines.append("")
+            yield "[음성 설정]"
+            yield f"  화자: {self.voice_settings.get('speaker', '-')}"
+            yield f"  속도: {self.voice_settings.get('speed', '-')}"
+            yield f"  볼륨: {self.voice_settings.get('volume', '-')}"
+            yield f"  피치: {self.voice_settings.get('pitch', '-')}"
+            yield f"  알파: {self.voice_settings.get('alpha', '-')}"
+            yield ""
+            yield "-" * 50
+            yield ""
 
         if self.issues:
-            lines.append(f"⚠️ 문제 구간: {len(self.issues)}개")
-            lines.append("")
+            yield f"⚠️ 문제 구간: {len(self.issues)}개"
+            yield ""
             
             for item in self.issues:
-                lines.append(f"[{item.timecode}] #{item.index}")
-                lines.append(f"  내용: {item.text}")
-                lines.append(f"  TTS: {item.tts_duration_ms/1000:.1f}초")
-                lines.append(f"  가용: {item.available_duration_ms/1000:.1f}초")
-                lines.append(f"  초과: {item.diff_ms/1000:.1f}초")
-                lines.append("")
+                yield f"[{item.timecode}] #{item.index}"
+                yield f"  내용: {item.text}"
+                yield f"  TTS: {item.tts_duration_ms/1000:.1f}초"
+                yield f"  가용: {item.available_duration_ms/1000:.1f}초"
+                yield f"  초과: {item.diff_ms/1000:.1f}초"
+                yield ""
         else:
-            lines.append("모든 구간 정상")
-            lines.append("")
+            yield "모든 구간 정상"
+            yield ""
         
-        lines.append("-" * 50)
-        lines.append(f"총 {summary['total']}개 구간")
-        lines.append(f"  - 정상: {summary['ok']}개")
-        lines.append(f"  - 초과: {summary['over']}개")
-        lines.append(f"  - 누락: {summary['missing']}개")
+        yield "-" * 50
+        yield f"총 {summary['total']}개 구간"
+        yield f"  - 정상: {summary['ok']}개"
+        yield f"  - 초과: {summary['over']}개"
+        yield f"  - 누락: {summary['missing']}개"
         
         if summary['total_over_ms'] > 0:
-            lines.append(f"  - 총 초과 시간: {summary['total_over_ms']/1000:.1f}초")
-        
-        lines.append("=" * 50)
+            yield f"  - 총 초과 시간: {summary['total_over_ms']/1000:.1f}초"
         
-        return "\n".join(lines)
+        yield "=" * 50
     
     def save_report(self, filepath: str):
-        """리포트를 파일로 저장"""
-        report = self.generate_report()
+        """리포트를 파일로 저장 (전체 문자열을 만들지 않고 라인 단위 기록)"""
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(report)
+            for line in self._iter_report_lines():
+                f.write(line)
+                f.write("\n")
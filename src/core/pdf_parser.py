@@ -1,15 +1,37 @@
 # core/pdf_parser.py
 # PDF 음성해설 대본 파서 v3.7 (y좌표 기반)
 
+import importlib.util
+import os
 import re
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Tuple, Optional, Dict
 
-try:
-    import fitz  # PyMuPDF
-    HAS_PYMUPDF = True
-except ImportError:
-    HAS_PYMUPDF = False
+# PyMuPDF는 C 확장 초기화 비용이 커서 실제로 PDF를 열 때 import (PDFParser.open)
+HAS_PYMUPDF = importlib.util.find_spec("fitz") is not None
+
+
+# 타임코드(4-6자리 숫자) 단어
+_TC_RE = re.compile(r'^\d{4,6}$')
+# 라인 앞의 타임코드 제거
+_TC_STRIP_RE = re.compile(r'^\d{4,6}\s*')
+# 연속 공백
+_WS_RE = re.compile(r'\s+')
+# 괄호 지시어 + 나머지 텍스트
+_BRACKET_RE = re.compile(r'\(([^)]+)\)\s*(.*)')
+
+# 타임코드 길이별 (시, 분, 초) 슬라이스
+# 4자리 MMSS / 5자리 HMMSS / 6자리 HHMMSS
+_TC_SLICES = {
+    4: (None, slice(0, 2), slice(2, 4)),
+    5: (slice(0, 1), slice(1, 3), slice(3, 5)),
+    6: (slice(0, 2), slice(2, 4), slice(4, 6)),
+}
 
 
 @dataclass
@@ -23,6 +45,36 @@ class ScriptEntry:
     script_text: str            # 음성해설 대본 텍스트
 
 
+class _WordColumns:
+    """단어 좌표를 열 단위(SoA)로 보관
+
+    단어마다 dict를 만드는 대신 페이지/좌표를 array로, 텍스트를 list로 저장한다.
+    정렬과 임계값 비교는 숫자 열만 사용한다.
+    """
+    __slots__ = ('page', 'x0', 'y0', 'x1', 'y1', 'text')
+    
+    def __init__(self):
+        self.page = array('i')
+        self.x0 = array('d')
+        self.y0 = array('d')
+        self.x1 = array('d')
+        self.y1 = array('d')
+        self.text: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.text)
+    
+    def add_page(self, page_num: int, words) -> None:
+        """page.get_text("words") 결과 추가"""
+        for w in words:
+            self.page.append(page_num)
+            self.x0.append(w[0])
+            self.y0.append(w[1])
+            self.x1.append(w[2])
+            self.y1.append(w[3])
+            self.text.append(w[4])
+
+
 class PDFParser:
     """
     PDF 음성해설 대본 파서 v3.7 (y좌표 기반)
@@ -42,6 +94,31 @@ class PDFParser:
     def __init__(self):
         if not HAS_PYMUPDF:
             raise ImportError("PyMuPDF 패키지가 필요합니다: pip install PyMuPDF")
+        # 마지막 추출 결과 ((경로, mtime, 크기), (words, underlines), 페이지 수)
+        self._extracted: Optional[Tuple[tuple, Tuple[_WordColumns, List[Dict]], int]] = None
+    
+    @contextmanager
+    def open(self, pdf_path: str):
+        """PDF 문서 열기 (with 블록 종료 시 닫힘)
+        
+        여러 정보가 필요한 호출자는 한 번 열어서 재사용:
+            with parser.open(path) as doc:
+                count = len(doc)
+        """
+        import fitz  # PyMuPDF
+        doc = fitz.open(pdf_path)
+        try:
+            yield doc
+        finally:
+            doc.close()
+    
+    def _cache_key(self, pdf_path: str) -> Optional[tuple]:
+        """추출 캐시 키 (절대경로, mtime, 크기)"""
+        try:
+            st = os.stat(pdf_path)
+        except OSError:
+            return None
+        return (os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
     
     def parse(self, pdf_path: str, 
               remove_slashes: bool = True,
@@ -59,37 +136,8 @@ class PDFParser:
         Returns:
             파싱된 ScriptEntry 리스트
         """
-        doc = fitz.open(pdf_path)
-        
         # 1. 모든 페이지에서 words와 밑줄 수집
-        all_words = []
-        all_underlines = []
-        
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            
-            # words 수집
-            for w in page.get_text("words"):
-                all_words.append({
-                    "page": page_num,
-                    "x0": w[0], "y0": w[1], "x1": w[2], "y1": w[3],
-                    "text": w[4]
-                })
-            
-            # 밑줄(수평선) 수집
-            for d in page.get_drawings():
-                items = d.get("items", [])
-                if items and items[0][0] == "l":
-                    start, end = items[0][1], items[0][2]
-                    if abs(start.y - end.y) < 1:  # 수평선
-                        all_underlines.append({
-                            "page": page_num,
-                            "y": start.y,
-                            "x0": min(start.x, end.x),
-                            "x1": max(start.x, end.x)
-                        })
-        
-        doc.close()
+        all_words, all_underlines = self._extract_words_underlines(pdf_path)
         
         # 2. 타임코드 앵커 우선 탐색
         timecode_anchors = self._find_timecode_anchors(all_words)
@@ -108,7 +156,50 @@ class PDFParser:
         
         return entries
     
-    def _find_timecode_anchors(self, words: List[Dict]) -> List[Dict]:
+    def _extract_words_underlines(self, pdf_path: str) -> Tuple[_WordColumns, List[Dict]]:
+        """모든 페이지에서 words와 밑줄(수평선) 수집
+
+        같은 파일(경로/수정시각/크기 동일)을 다시 요청하면 직전 결과를 재사용한다.
+        (parse() 후 get_all_underlined_text() 호출 시 PDF를 한 번만 읽음)
+        """
+        key = self._cache_key(pdf_path)
+        if key is not None and self._extracted is not None and self._extracted[0] == key:
+            return self._extracted[1]
+        
+        with self.open(pdf_path) as doc:
+            result = self._collect_words_underlines(doc)
+            page_count = len(doc)
+        
+        self._extracted = (key, result, page_count) if key is not None else None
+        return result
+    
+    def _collect_words_underlines(self, doc) -> Tuple[_WordColumns, List[Dict]]:
+        """열린 문서의 모든 페이지에서 words와 밑줄(수평선) 수집"""
+        all_words = _WordColumns()
+        all_underlines = []
+        
+        for page_num in range(len(doc)):
+            page = doc[page_num]
+            
+            # words 수집
+            all_words.add_page(page_num, page.get_text("words"))
+            
+            # 밑줄(수평선) 수집 - get_cdrawings: 좌표를 Point 객체 대신 튜플로 반환 (C 경로)
+            for d in page.get_cdrawings():
+                items = d.get("items", [])
+                if items and items[0][0] == "l":
+                    (sx, sy), (ex, ey) = items[0][1], items[0][2]
+                    if abs(sy - ey) < 1:  # 수평선
+                        all_underlines.append({
+                            "page": page_num,
+                            "y": sy,
+                            "x0": min(sx, ex),
+                            "x1": max(sx, ex)
+                        })
+        
+        return all_words, all_underlines
+    
+    def _find_timecode_anchors(self, words: _WordColumns) -> List[Dict]:
         """타임코드 위치를 먼저 찾아 앵커로 저장
 
         타임코드 형식:
@@ -117,93 +208,108 @@ class PDFParser:
         - 6자리: HHMMSS (예: 015628 = 01시간 56분 28초)
         """
         anchors = []
-        # 4-6자리 숫자 패턴 (60분 이상 타임코드 지원)
-        tc_pattern = re.compile(r'^\d{4,6}$')
 
-        for w in words:
-            text = w["text"].strip()
-            if tc_pattern.match(text):
+        for i, raw in enumerate(words.text):
+            text = raw.strip()
+            if _TC_RE.match(text):  # 4-6자리 숫자 (60분 이상 타임코드 지원)
                 # 타임코드 유효성 검증
                 if self._is_valid_timecode(text):
                     anchors.append({
                         "timecode": text,
-                        "page": w["page"],
-                        "y": w["y0"],
-                        "x": w["x0"]
+                        "page": words.page[i],
+                        "y": words.y0[i],
+                        "x": words.x0[i]
                     })
         
         # 페이지, y좌표 순 정렬
-        anchors.sort(key=lambda x: (x["page"], x["y"], x["x"]))
-        
-        # 중복 제거 (같은 y좌표에 있는 타임코드)
-        unique_anchors = []
-        prev_key = None
-        for a in anchors:
-            key = (a["page"], round(a["y"] / 10))  # 10px 단위로 그룹화
-            if key != prev_key:
-                unique_anchors.append(a)
-                prev_key = key
-        
-        return unique_anchors
+        anchors.sort(key=itemgetter("page", "y", "x"))
+        
+        # 중복 제거 (같은 y좌표에 있는 타임코드) - 10px 단위 그룹의 첫 항목만
+        groups = groupby(anchors, key=lambda a: (a["page"], round(a["y"] / 10)))
+        return [next(group) for _, group in groups]
     
-    def _is_underlined(self, word: Dict, underlines: List[Dict]) -> bool:
-        """단어에 밑줄이 있는지 확인"""
+    def _index_underlines(self, underlines: List[Dict]) -> Dict[int, Tuple[list, list, list]]:
+        """밑줄을 페이지별로 묶고 y좌표 순으로 정렬 → {page: (ys, x0s, x1s)}"""
+        by_page: Dict[int, list] = {}
         for ul in underlines:
-            if ul["page"] != word["page"]:
-                continue
-            # 밑줄이 텍스트 하단 바로 아래 (0~5px)
-            y_diff = ul["y"] - word["y1"]
-            if 0 < y_diff < 5:
+            by_page.setdefault(ul["page"], []).append((ul["y"], ul["x0"], ul["x1"]))
+        
+        index = {}
+        for page, items in by_page.items():
+            items.sort()
+            ys, x0s, x1s = zip(*items)
+            index[page] = (list(ys), list(x0s), list(x1s))
+        return index
+    
+    def _is_underlined(self, words: _WordColumns, i: int,
+                       underline_index: Dict[int, Tuple[list, list, list]]) -> bool:
+        """i번째 단어에 밑줄이 있는지 확인"""
+        band = underline_index.get(words.page[i])
+        if band is None:
+            return False
+        ys, ul_x0s, ul_x1s = band
+        y1 = words.y1[i]
+        x0 = words.x0[i]
+        x1 = words.x1[i]
+        
+        # 밑줄이 텍스트 하단 바로 아래 (0~5px) - 이분 탐색으로 후보 구간만 확인
+        lo = bisect_right(ys, y1)
+        hi = bisect_left(ys, y1 + 6, lo)
+        for k in range(lo, hi):
+            if ys[k] - y1 < 5:
                 # x 범위 겹침 확인
-                if word["x0"] < ul["x1"] and word["x1"] > ul["x0"]:
+                if x0 < ul_x1s[k] and x1 > ul_x0s[k]:
                     return True
         return False
     
-    def _group_words_by_y(self, words: List[Dict], 
+    def _group_words_by_y(self, words: _WordColumns,
                           underlines: List[Dict]) -> List[Dict]:
         """y좌표 기준으로 라인 그룹화 (block/line 무시)"""
-        if not words:
+        if not len(words):
             return []
         
-        # 페이지, y좌표 순 정렬
-        sorted_words = sorted(words, key=lambda x: (x["page"], x["y0"], x["x0"]))
+        # 페이지, y좌표 순 정렬 (동일 좌표는 원래 순서 유지)
+        order = [i for _, _, _, i in sorted(zip(words.page, words.y0, words.x0, range(len(words))))]
+        pages = words.page
+        y0s = words.y0
+        underline_index = self._index_underlines(underlines)
         
-        lines = []
-        current_line_words = [sorted_words[0]]
-        current_y = sorted_words[0]["y0"]
-        current_page = sorted_words[0]["page"]
+        # 라인 번호 부여
+        line_ids = []
+        line_id = 0
+        current_y = y0s[order[0]]
+        current_page = pages[order[0]]
         
-        for w in sorted_words[1:]:
+        for i in order:
             # 페이지 변경 또는 y좌표 차이가 임계값 초과
-            if w["page"] != current_page or abs(w["y0"] - current_y) > self.Y_LINE_THRESHOLD:
-                # 현재 라인 저장
-                line = self._merge_line_words(current_line_words, underlines)
-                lines.append(line)
-                
-                current_line_words = [w]
-                current_y = w["y0"]
-                current_page = w["page"]
-            else:
-                current_line_words.append(w)
+            if pages[i] != current_page or abs(y0s[i] - current_y) > self.Y_LINE_THRESHOLD:
+                line_id += 1
+                current_y = y0s[i]
+                current_page = pages[i]
+            line_ids.append(line_id)
+        
+        # (라인 번호, x좌표) 순으로 한 번에 정렬 - 같은 x는 위 정렬 순서 유지
+        x0s = words.x0
+        ordered = sorted(zip(line_ids, [x0s[i] for i in order], range(len(order)), order))
         
-        # 마지막 라인
-        if current_line_words:
-            line = self._merge_line_words(current_line_words, underlines)
+        lines = []
+        for _, group in groupby(ordered, key=itemgetter(0)):
+            line = self._merge_line_words(words, [g[3] for g in group], underline_index)
             lines.append(line)
         
         return lines
     
-    def _merge_line_words(self, words: List[Dict], underlines: List[Dict]) -> Dict:
-        """같은 라인의 단어들을 병합"""
-        # x좌표 순 정렬
-        words.sort(key=lambda x: x["x0"])
-        
-        text = " ".join(w["text"] for w in words)
-        has_underline = any(self._is_underlined(w, underlines) for w in words)
+    def _merge_line_words(self, words: _WordColumns, indices: List[int],
+                          underline_index: Dict[int, Tuple[list, list, list]]) -> Dict:
+        """같은 라인의 단어들을 병합 (indices는 x좌표 순으로 정렬된 상태)"""
+        texts = words.text
+        text = " ".join(texts[i] for i in indices)
+        has_underline = any(self._is_underlined(words, i, underline_index) for i in indices)
         
+        first = indices[0]
         return {
-            "page": words[0]["page"],
-            "y": words[0]["y0"],
+            "page": words.page[first],
+            "y": words.y0[first],
             "text": text,
             "underlined": has_underline
         }
@@ -216,6 +322,9 @@ class PDFParser:
         """각 라인을 해당 타임코드 영역에 할당 (페이지 걸침 지원)"""
         entries = []
 
+        # 라인은 (페이지, y좌표) 순으로 정렬되어 있으므로 영역 경계를 이분 탐색
+        line_keys = [(line["page"], line["y"]) for line in lines]
+
         for i, anchor in enumerate(anchors):
             tc = anchor["timecode"]
             tc_page = anchor["page"]
@@ -230,20 +339,10 @@ class PDFParser:
                 next_y = float('inf')
 
             # 이 타임코드 영역의 라인들 수집 (페이지 걸침 지원)
-            region_lines = []
-            for line in lines:
-                line_page = line["page"]
-                line_y = line["y"]
-
-                # 현재 타임코드 위치 이전이면 스킵
-                if (line_page, line_y) < (tc_page, tc_y - 5):
-                    continue
-
-                # 다음 타임코드 위치 이후면 스킵
-                if (line_page, line_y) >= (next_page, next_y - 5):
-                    continue
-
-                region_lines.append(line)
+            # [현재 타임코드 위치, 다음 타임코드 위치) 구간
+            lo = bisect_left(line_keys, (tc_page, tc_y - 5))
+            hi = bisect_left(line_keys, (next_page, next_y - 5), lo)
+            region_lines = lines[lo:hi]
 
             # 타임코드와 같은 라인에서 지시어 추출
             instructions = []
@@ -253,10 +352,10 @@ class PDFParser:
                 text = line["text"]
 
                 # 타임코드 자체 제거 (4-6자리)
-                text = re.sub(r'^\d{4,6}\s*', '', text)
+                text = _TC_STRIP_RE.sub('', text)
 
                 # 괄호 지시어 추출
-                bracket_match = re.match(r'\(([^)]+)\)\s*(.*)', text)
+                bracket_match = _BRACKET_RE.match(text)
                 if bracket_match:
                     instr = bracket_match.group(1)
                     if not any(kw in instr for kw in self.SOUND_KEYWORDS):
@@ -310,7 +409,7 @@ class PDFParser:
             script_text = f"({bracket_content}) {script_text}"
         
         # 연속 공백 제거
-        script_text = re.sub(r'\s+', ' ', script_text).strip()
+        script_text = _WS_RE.sub(' ', script_text).strip()
         
         if not script_text:
             return None
@@ -333,30 +432,20 @@ class PDFParser:
         Returns:
             유효한 타임코드이면 True
         """
-        try:
-            length = len(raw)
-
-            if length == 4:
-                # MMSS: 분(00-99), 초(00-59)
-                minutes = int(raw[:2])
-                seconds = int(raw[2:])
-                return 0 <= minutes <= 99 and 0 <= seconds <= 59
-            elif length == 5:
-                # HMMSS: 시(0-9), 분(00-59), 초(00-59)
-                hours = int(raw[0])
-                minutes = int(raw[1:3])
-                seconds = int(raw[3:])
-                return 0 <= hours <= 9 and 0 <= minutes <= 59 and 0 <= seconds <= 59
-            elif length == 6:
-                # HHMMSS: 시(00-99), 분(00-59), 초(00-59)
-                hours = int(raw[:2])
-                minutes = int(raw[2:4])
-                seconds = int(raw[4:])
-                return 0 <= hours <= 99 and 0 <= minutes <= 59 and 0 <= seconds <= 59
-            return False
-        except ValueError:
+        slices = _TC_SLICES.get(len(raw))
+        if slices is None or not raw.isdecimal():
             return False
 
+        h_slice, m_slice, s_slice = slices
+        minutes = int(raw[m_slice])
+        seconds = int(raw[s_slice])
+
+        if h_slice is None:
+            # MMSS: 분(00-99), 초(00-59)
+            return seconds <= 59
+        # HMMSS / HHMMSS: 시(자릿수 범위), 분(00-59), 초(00-59)
+        return minutes <= 59 and seconds <= 59
+
     def _parse_timecode(self, raw: str) -> Tuple[str, int]:
         """
         4-6자리 타임코드를 HH:MM:SS:FF 형식과 밀리초로 변환
@@ -366,31 +455,24 @@ class PDFParser:
         - 5자리 HMMSS: "11111" → ("01:11:11:00", 4271000) - 1시간 11분 11초
         - 6자리 HHMMSS: "015628" → ("01:56:28:00", 7028000) - 1시간 56분 28초
         """
-        length = len(raw)
+        slices = _TC_SLICES.get(len(raw))
 
-        if length == 4:
-            # MMSS 형식
-            minutes = int(raw[:2])
-            seconds = int(raw[2:])
-            hours = minutes // 60
-            minutes = minutes % 60
-        elif length == 5:
-            # HMMSS 형식 (시간 1자리)
-            hours = int(raw[0])
-            minutes = int(raw[1:3])
-            seconds = int(raw[3:])
-        elif length == 6:
-            # HHMMSS 형식 (시간 2자리)
-            hours = int(raw[:2])
-            minutes = int(raw[2:4])
-            seconds = int(raw[4:])
-        else:
+        if slices is None:
             # 기본값 (4자리로 처리)
             raw = raw.zfill(4)
             minutes = int(raw[:2])
             seconds = int(raw[2:])
             hours = minutes // 60
             minutes = minutes % 60
+        else:
+            h_slice, m_slice, s_slice = slices
+            minutes = int(raw[m_slice])
+            seconds = int(raw[s_slice])
+            if h_slice is None:
+                # MMSS 형식 (60분 이상은 시간으로 올림)
+                hours, minutes = divmod(minutes, 60)
+            else:
+                hours = int(raw[h_slice])
 
         tc_formatted = f"{hours:02d}:{minutes:02d}:{seconds:02d}:00"
         tc_ms = (hours * 3600 + minutes * 60 + seconds) * 1000
@@ -399,10 +481,12 @@ class PDFParser:
     
     def get_page_count(self, pdf_path: str) -> int:
         """PDF 페이지 수 반환"""
-        doc = fitz.open(pdf_path)
-        count = len(doc)
-        doc.close()
-        return count
+        key = self._cache_key(pdf_path)
+        if key is not None and self._extracted is not None and self._extracted[0] == key:
+            return self._extracted[2]
+        
+        with self.open(pdf_path) as doc:
+            return len(doc)
 
     def get_all_underlined_text(self, pdf_path: str) -> str:
         """
@@ -418,37 +502,8 @@ class PDFParser:
         Returns:
             밑줄이 그어진 모든 텍스트 (공백으로 연결)
         """
-        doc = fitz.open(pdf_path)
-
-        # 모든 페이지에서 words와 밑줄 수집
-        all_words = []
-        all_underlines = []
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-
-            # words 수집
-            for w in page.get_text("words"):
-                all_words.append({
-                    "page": page_num,
-                    "x0": w[0], "y0": w[1], "x1": w[2], "y1": w[3],
-                    "text": w[4]
-                })
-
-            # 밑줄(수평선) 수집
-            for d in page.get_drawings():
-                items = d.get("items", [])
-                if items and items[0][0] == "l":
-                    start, end = items[0][1], items[0][2]
-                    if abs(start.y - end.y) < 1:  # 수평선
-                        all_underlines.append({
-                            "page": page_num,
-                            "y": start.y,
-                            "x0": min(start.x, end.x),
-                            "x1": max(start.x, end.x)
-                        })
-
-        doc.close()
+        # 모든 페이지에서 words와 밑줄 수집 (parse() 직후라면 재사용)
+        all_words, all_underlines = self._extract_words_underlines(pdf_path)
 
         # 라인 단위로 그룹화 (parse()와 동일한 로직)
         lines = self._group_words_by_y(all_words, all_underlines)
@@ -458,7 +513,7 @@ class PDFParser:
         for line in lines:
             if line["underlined"]:
                 # 타임코드 제거 (4-6자리 숫자)
-                text = re.sub(r'^\d{4,6}\s*', '', line["text"])
+                text = _TC_STRIP_RE.sub('', line["text"])
                 # 괄호 지시어는 제거하지 않음 (파싱 로직과 동일하게 유지)
                 text = text.strip()
                 if text:
@@ -468,7 +523,7 @@ class PDFParser:
         all_text = " ".join(underlined_texts)
 
         # 연속 공백 제거
-        all_text = re.sub(r'\s+', ' ', all_text).strip()
+        all_text = _WS_RE.sub(' ', all_text).strip()
 
         return all_text
 
@@ -4,6 +4,41 @@
 import re
 from typing import List, Optional
 from .pdf_parser import ScriptEntry
+from ..utils.timecode import ms_to_srt_time
+
+# 괄호 내용
+_PAREN_RE = re.compile(r'\([^)]*\)')
+# 마침표 + 공백 (줄바꿈 위치)
+_PERIOD_BREAK_RE = re.compile(r'\.\s+')
+
+# save_streaming 파일 버퍼 크기
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _clean_text(text: str) -> str:
+    """괄호 내용 제거 후 연속 공백을 한 칸으로 정리"""
+    if '(' in text:
+        text = _PAREN_RE.sub('', text)
+    # str.split() 의 공백 기준은 정규식 \s 와 같음
+    return ' '.join(text.split())
+
+
+def _find_break(line: str, pos: int) -> int:
+    """pos 이후 첫 공백/쉼표 위치 (없으면 -1)"""
+    space = line.find(' ', pos)
+    comma = line.find(',', pos)
+    if space < 0:
+        return comma
+    if comma < 0:
+        return space
+    return min(space, comma)
+
+
+def _join_blocks(parts: List[str]) -> str:
+    """블록 조각을 한 번에 결합 (마지막 블록 뒤에는 빈 줄 없음)"""
+    if parts:
+        parts[-1] = '\n'
+    return ''.join(parts)
 
 
 class SRTGenerator:
@@ -29,8 +64,41 @@ class SRTGenerator:
         Returns:
             SRT 파일 내용 문자열
         """
-        srt_content = []
+        parts = []
         
+        for index, start_ms, end_ms, text in self._iter_entries(
+                entries, max_chars_per_line, break_on_period, remove_brackets):
+            # SRT 블록 (블록 사이 빈 줄 포함)
+            parts.extend((
+                str(index), '\n',
+                ms_to_srt_time(start_ms), ' --> ', ms_to_srt_time(end_ms), '\n',
+                text, '\n\n'
+            ))
+        
+        return _join_blocks(parts)
+    
+    def save_streaming(self, entries: List[ScriptEntry], filepath: str,
+                       max_chars_per_line: int = 40,
+                       break_on_period: bool = True,
+                       remove_brackets: bool = True,
+                       encoding: str = 'utf-8'):
+        """SRT 내용을 문자열로 만들지 않고 블록 단위로 바로 파일에 저장
+        
+        generate() + save() 와 같은 내용을 기록한다.
+        """
+        with open(filepath, 'w', encoding=encoding, buffering=_WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            sep = ''
+            for index, start_ms, end_ms, text in self._iter_entries(
+                    entries, max_chars_per_line, break_on_period, remove_brackets):
+                write(f"{sep}{index}\n{ms_to_srt_time(start_ms)} --> {ms_to_srt_time(end_ms)}\n{text}\n")
+                sep = '\n'
+    
+    def _iter_entries(self, entries: List[ScriptEntry],
+                      max_chars_per_line: int,
+                      break_on_period: bool,
+                      remove_brackets: bool):
+        """항목별 (번호, 시작ms, 종료ms, 포맷된 텍스트) 순차 생성"""
         for i, entry in enumerate(entries):
             # 시작/종료 시간
             start_ms = entry.timecode_ms
@@ -45,19 +113,11 @@ class SRTGenerator:
             text = entry.script_text
             
             if remove_brackets:
-                text = re.sub(r'\([^)]*\)', '', text)
-                text = re.sub(r'\s+', ' ', text).strip()
+                text = _clean_text(text)
             
             text = self._format_text(text, max_chars_per_line, break_on_period)
             
-            # SRT 블록 생성
-            srt_block = f"{entry.index}\n"
-            srt_block += f"{self._ms_to_srt_time(start_ms)} --> {self._ms_to_srt_time(end_ms)}\n"
-            srt_block += f"{text}\n"
-            
-            srt_content.append(srt_block)
-        
-        return '\n'.join(srt_content)
+            yield entry.index, start_ms, end_ms, text
     
     def generate_from_entries_with_duration(self, entries: List[dict]) -> str:
         """
@@ -66,15 +126,16 @@ class SRTGenerator:
         Args:
             entries: [{'index': 1, 'start_ms': 0, 'end_ms': 5000, 'text': '...'}]
         """
-        srt_content = []
+        parts = []
         
         for entry in entries:
-            srt_block = f"{entry['index']}\n"
-            srt_block += f"{self._ms_to_srt_time(entry['start_ms'])} --> {self._ms_to_srt_time(entry['end_ms'])}\n"
-            srt_block += f"{entry['text']}\n"
-            srt_content.append(srt_block)
+            parts.extend((
+                str(entry['index']), '\n',
+                ms_to_srt_time(entry['start_ms']), ' --> ', ms_to_srt_time(entry['end_ms']), '\n',
+                str(entry['text']), '\n\n'
+            ))
         
-        return '\n'.join(srt_content)
+        return _join_blocks(parts)
     
     def _format_text(self, text: str, 
                      max_chars: int, 
@@ -83,7 +144,7 @@ class SRTGenerator:
         
         if break_on_period:
             # 마침표 뒤에 줄바꿈
-            text = re.sub(r'\.\s+', '.\n', text)
+            text = _PERIOD_BREAK_RE.sub('.\n', text)
         
         # 줄당 글자 수 제한
         lines = []
@@ -95,26 +156,22 @@ class SRTGenerator:
             if len(line) <= max_chars:
                 lines.append(line)
             else:
-                # 긴 줄 분할
-                current = ""
-                for char in line:
-                    current += char
-                    if len(current) >= max_chars and char in ' ,':
-                        lines.append(current.strip())
-                        current = ""
-                if current.strip():
-                    lines.append(current.strip())
+                # 긴 줄 분할: max_chars 지점으로 건너뛴 뒤 다음 공백/쉼표에서 자름
+                start = 0
+                while True:
+                    cut = _find_break(line, start + max(max_chars, 1) - 1)
+                    if cut < 0:
+                        break
+                    lines.append(line[start:cut + 1].strip())
+                    start = cut + 1
+                rest = line[start:].strip()
+                if rest:
+                    lines.append(rest)
         
         return '\n'.join(lines)
     
-    def _ms_to_srt_time(self, ms: int) -> str:
-        """밀리초를 SRT 시간 형식으로 변환"""
-        hours = ms // 3600000
-        minutes = (ms % 3600000) // 60000
-        seconds = (ms % 60000) // 1000
-        milliseconds = ms % 1000
-        
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+    # 밀리초 → SRT 시간 (utils.timecode 공용 구현)
+    _ms_to_srt_time = staticmethod(ms_to_srt_time)
     
     def save(self, content: str, filepath: str, encoding: str = 'utf-8'):
         """SRT 파일 저장"""
@@ -3,10 +3,57 @@
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
-@dataclass
+def _fast_time(s: str) -> int:
+    """'HH:MM:SS,mmm' 을 밀리초로 변환 (고정 위치 슬라이싱)"""
+    return int(s[0:2]) * 3600000 + int(s[3:5]) * 60000 + int(s[6:8]) * 1000 + int(s[9:12])
+
+
+def _is_srt_time(s: str, ms_seps: str) -> bool:
+    """고정 폭 'HH:MM:SS,mmm' 형식인지 확인"""
+    return (
+        len(s) == 12 and s[2] == ':' and s[5] == ':' and s[8] in ms_seps
+        and (s[0:2] + s[3:5] + s[6:8] + s[9:12]).isdecimal()
+    )
+
+
+def split_srt_blocks(content: str,
+                     ms_seps: str = ',') -> Optional[List[Tuple[int, int, int, str]]]:
+    """빈 줄 기준 블록 분할로 SRT 파싱 (정규식 없이 선형 처리)
+    
+    Args:
+        content: LF 줄바꿈 SRT 내용
+        ms_seps: 밀리초 구분자로 허용할 문자
+    
+    Returns:
+        (index, start_ms, end_ms, text) 리스트.
+        형식에서 벗어난 블록이 있으면 None (호출 측에서 정규식으로 폴백)
+    """
+    if content.startswith('\ufeff'):
+        content = content[1:]
+    
+    blocks = []
+    for block in content.strip().split('\n\n'):
+        block = block.strip()
+        if not block:
+            continue
+        
+        lines = block.split('\n', 2)
+        if len(lines) < 3 or not lines[0].isdecimal():
+            return None
+        
+        t1, sep, t2 = lines[1].partition(' --> ')
+        if not (sep and _is_srt_time(t1, ms_seps) and _is_srt_time(t2, ms_seps)):
+            return None
+        
+        blocks.append((int(lines[0]), _fast_time(t1), _fast_time(t2), lines[2]))
+    
+    return blocks
+
+
+@dataclass(slots=True)
 class SRTEntry:
     """SRT 항목 데이터 클래스"""
     index: int
@@ -48,14 +95,16 @@ class SRTParser:
         self.filepath = filepath
         self.entries = []
         
-        # 여러 인코딩 시도
+        # 파일은 한 번만 읽고 메모리에서 여러 인코딩 시도
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        
         encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'latin-1']
         content = None
         
         for encoding in encodings:
             try:
-                with open(filepath, 'r', encoding=encoding) as f:
-                    content = f.read()
+                content = raw.decode(encoding)
                 break
             except UnicodeDecodeError:
                 continue
@@ -63,39 +112,29 @@ class SRTParser:
         if content is None:
             raise ValueError(f"파일을 읽을 수 없습니다: {filepath}")
         
-        for match in self.SRT_PATTERN.finditer(content):
-            idx = int(match.group(1))
-            
-            start_ms = (
-                int(match.group(2)) * 3600000 +
-                int(match.group(3)) * 60000 +
-                int(match.group(4)) * 1000 +
-                int(match.group(5))
-            )
-            
-            end_ms = (
-                int(match.group(6)) * 3600000 +
-                int(match.group(7)) * 60000 +
-                int(match.group(8)) * 1000 +
-                int(match.group(9))
-            )
-            
-            text = match.group(10).strip().replace('\n', ' ')
-            
-            entry = SRTEntry(
-                index=idx,
-                start_ms=start_ms,
-                end_ms=end_ms,
-                text=text
-            )
-            self.entries.append(entry)
-        
-        return self.entries
+        # 텍스트 모드 읽기와 같은 줄바꿈 정규화
+        return self.parse_text(content.replace('\r\n', '\n').replace('\r', '\n'))
     
     def parse_text(self, content: str) -> List[SRTEntry]:
         """SRT 텍스트 내용 파싱"""
         self.entries = []
+        content = content.replace('\r\n', '\n')
+        
+        # 숫자만 있는 텍스트 줄은 SRT_PATTERN 이 블록 경계로 보므로 정규식 경로 사용
+        blocks = split_srt_blocks(content)
+        if blocks is not None and not any(
+            line.isdecimal() for *_, text in blocks for line in text.split('\n')
+        ):
+            for idx, start_ms, end_ms, text in blocks:
+                self.entries.append(SRTEntry(
+                    index=idx,
+                    start_ms=start_ms,
+                    end_ms=end_ms,
+                    text=text.strip().replace('\n', ' ')
+                ))
+            return self.entries
         
+        # 형식이 어긋난 파일 - 정규식으로 폴백
         for match in self.SRT_PATTERN.finditer(content):
             idx = int(match.group(1))
             
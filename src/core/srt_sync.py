@@ -1,14 +1,112 @@
 # core/srt_sync.py
 # SRT-WAV 동기화 모듈
 
+import csv
 import os
 import re
-import wave
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
+from .srt_parser import split_srt_blocks
+from ..utils.audio import read_wav_header
+from ..utils.timecode import ms_to_srt_time
 
 
-@dataclass
+# SRT 블록 패턴 (split_srt_blocks 실패 시 폴백)
+_SRT_BLOCK_RE = re.compile(
+    r'(\d+)\n'
+    r'(\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[,\.]\d{3})\n'
+    r'(.*?)(?=\n\n|\n*$)',
+    re.DOTALL
+)
+
+# 리포트 상태 표시 문자열
+_STATUS_DISPLAY = {'synced': 'OK', 'shorter': '여유', 'longer': '초과', 'missing': '누락'}
+
+# WAV 길이 병렬 읽기 설정
+_MAX_WORKERS = 16
+_PARALLEL_MIN = 8
+
+# 리포트 열 제목
+_REPORT_HEADERS = ["#", "타임코드", "원본길이(ms)", "WAV길이(ms)", "차이(ms)", "상태"]
+
+# XLSX 비동기 저장용 프로세스 풀 (처음 사용할 때 생성, 작업 프로세스가 죽으면 다시 생성)
+_report_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _discard_report_pool(pool: ProcessPoolExecutor):
+    """깨진 리포트 풀 폐기 - 다음 저장 때 새 풀을 만든다"""
+    global _report_pool
+    if _report_pool is pool:
+        _report_pool = None
+    pool.shutdown(wait=False)
+
+
+def _submit_report(output_path: str, rows) -> Future:
+    """리포트 풀에 XLSX 저장 제출 (풀이 깨져 있으면 새로 만들어 한 번 재시도)"""
+    global _report_pool
+    for attempt in range(2):
+        if _report_pool is None:
+            _report_pool = ProcessPoolExecutor(max_workers=1)
+        pool = _report_pool
+        try:
+            future = pool.submit(_write_xlsx_report, output_path, rows)
+        except BrokenProcessPool:
+            _discard_report_pool(pool)
+            if attempt:
+                raise
+            continue
+        # 실행 중에 작업 프로세스가 죽어도 다음 저장은 새 풀에서 하도록
+        def _on_done(f: Future, pool=pool):
+            if not f.cancelled() and isinstance(f.exception(), BrokenProcessPool):
+                _discard_report_pool(pool)
+        future.add_done_callback(_on_done)
+        return future
+
+
+# XLSX 헤더 스타일 (openpyxl 첫 사용 시 생성 후 재사용)
+_BOLD_FONT = None
+_CENTER_ALIGN = None
+
+
+def _write_xlsx_report(output_path: str, rows: List[tuple]) -> bool:
+    """XLSX 리포트 기록 (별도 프로세스에서도 실행되도록 모듈 함수로 둠)"""
+    global _BOLD_FONT, _CENTER_ALIGN
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        
+        if _BOLD_FONT is None:
+            from openpyxl.styles import Font, Alignment
+            _BOLD_FONT = Font(bold=True)
+            _CENTER_ALIGN = Alignment(horizontal='center')
+        
+        # 쓰기 전용 모드: 셀 객체를 메모리에 쌓지 않고 행 단위로 기록
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("동기화 리포트")
+        
+        # 헤더
+        header_cells = []
+        for header in _REPORT_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = _BOLD_FONT
+            cell.alignment = _CENTER_ALIGN
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # 데이터
+        for row in rows:
+            ws.append(row)
+        
+        wb.save(output_path)
+        return True
+    except Exception:
+        return False
+
+
+@dataclass(slots=True)
 class SyncEntry:
     """동기화 항목"""
     index: int
@@ -20,6 +118,9 @@ class SyncEntry:
     wav_filename: str
     status: str  # 'synced', 'shorter', 'longer', 'missing'
     diff_ms: int
+    # 리포트/SRT 출력용 포맷 문자열 캐시 (처음 필요할 때 채움)
+    tc_display: Optional[str] = field(default=None, repr=False, compare=False)
+    srt_times: Optional[Tuple[str, str]] = field(default=None, repr=False, compare=False)
 
 
 class SRTSync:
@@ -29,6 +130,19 @@ class SRTSync:
         self.fps = fps
         self.entries: List[SyncEntry] = []
     
+    @property
+    def fps(self) -> float:
+        return self._fps
+    
+    @fps.setter
+    def fps(self, fps: float):
+        self._fps = fps
+        # 밀리초 나머지(0~999) → 프레임 번호 표 (변환마다 나눗셈/곱셈 생략)
+        self._frame_table = [int(rem / 1000 * fps) for rem in range(1000)]
+        # fps가 바뀌면 타임코드 표시 캐시 무효화
+        for entry in getattr(self, 'entries', ()):
+            entry.tc_display = None
+    
     def parse_srt(self, srt_path: str) -> List[dict]:
         """SRT 파일 파싱"""
         entries = []
@@ -36,15 +150,15 @@ class SRTSync:
         with open(srt_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # SRT 블록 패턴
-        pattern = re.compile(
-            r'(\d+)\n'
-            r'(\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[,\.]\d{3})\n'
-            r'(.*?)(?=\n\n|\n*$)',
-            re.DOTALL
-        )
+        blocks = split_srt_blocks(content, ',.')
+        if blocks is not None:
+            return [
+                {'index': index, 'start_ms': start_ms, 'end_ms': end_ms, 'text': text.strip()}
+                for index, start_ms, end_ms, text in blocks
+            ]
         
-        for match in pattern.finditer(content):
+        # 형식이 어긋난 파일 - 정규식으로 폴백
+        for match in _SRT_BLOCK_RE.finditer(content):
             index = int(match.group(1))
             start_time = match.group(2)
             end_time = match.group(3)
@@ -71,30 +185,35 @@ class SRTSync:
         
         return hours * 3600000 + minutes * 60000 + seconds * 1000 + ms
     
-    def _ms_to_srt_time(self, ms: int) -> str:
-        """밀리초를 SRT 시간 형식으로 변환"""
-        hours = ms // 3600000
-        minutes = (ms % 3600000) // 60000
-        seconds = (ms % 60000) // 1000
-        milliseconds = ms % 1000
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+    # 밀리초 → SRT 시간 (utils.timecode 공용 구현)
+    _ms_to_srt_time = staticmethod(ms_to_srt_time)
     
     def _ms_to_filename_tc(self, ms: int) -> str:
         """밀리초를 파일명용 타임코드로 변환"""
-        hours = ms // 3600000
-        minutes = (ms % 3600000) // 60000
-        seconds = (ms % 60000) // 1000
-        frames = int((ms % 1000) / 1000 * self.fps)
+        q, rem = divmod(ms, 1000)
+        q, seconds = divmod(q, 60)
+        hours, minutes = divmod(q, 60)
+        frames = self._frame_table[rem]
         return f"{hours:02d}_{minutes:02d}_{seconds:02d}_{frames:02d}"
     
+    def _tc_display(self, entry: SyncEntry) -> str:
+        """리포트용 타임코드 (HH:MM:SS:FF, 항목에 캐시)"""
+        if entry.tc_display is None:
+            entry.tc_display = self._ms_to_filename_tc(entry.start_ms).replace('_', ':')
+        return entry.tc_display
+    
+    def _srt_times(self, entry: SyncEntry) -> Tuple[str, str]:
+        """동기화 SRT 시작/종료 시간 문자열 (항목에 캐시)"""
+        if entry.srt_times is None:
+            end_ms = entry.original_end_ms if entry.status == 'missing' else entry.synced_end_ms
+            entry.srt_times = (ms_to_srt_time(entry.start_ms), ms_to_srt_time(end_ms))
+        return entry.srt_times
+    
     def get_wav_duration(self, wav_path: str) -> Optional[int]:
-        """WAV 파일 길이(밀리초) 반환"""
+        """WAV 파일 길이(밀리초) 반환 (파일이 없거나 읽을 수 없으면 None)"""
         try:
-            with wave.open(wav_path, 'rb') as wav_file:
-                frames = wav_file.getnframes()
-                rate = wav_file.getframerate()
-                duration_ms = int(frames / rate * 1000)
-                return duration_ms
+            rate, _, _, frames = read_wav_header(wav_path)
+            return int(frames / rate * 1000)
         except Exception:
             return None
     
@@ -112,72 +231,57 @@ class SRTSync:
         self.entries = []
         srt_entries = self.parse_srt(srt_path)
         
-        for entry in srt_entries:
-            # WAV 파일명 생성 (타임코드 기반)
-            tc_filename = self._ms_to_filename_tc(entry['start_ms'])
-            wav_filename = f"{tc_filename}.wav"
-            wav_path = os.path.join(wav_folder, wav_filename)
-            
-            # WAV 길이 확인
-            wav_duration = self.get_wav_duration(wav_path) if os.path.exists(wav_path) else None
+        # WAV 파일명 생성 (타임코드 기반)
+        tc_filenames = [self._ms_to_filename_tc(entry['start_ms']) for entry in srt_entries]
+        wav_paths = [os.path.join(wav_folder, f"{tc}.wav") for tc in tc_filenames]
+        
+        # WAV 길이 확인 (헤더 읽기는 I/O 대기이므로 스레드로 겹침)
+        if len(wav_paths) < _PARALLEL_MIN:
+            durations = [self.get_wav_duration(path) for path in wav_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as ex:
+                durations = list(ex.map(self.get_wav_duration, wav_paths))
+        
+        append = self.entries.append
+        for entry, tc_filename, wav_duration in zip(srt_entries, tc_filenames, durations):
+            start_ms = entry['start_ms']
+            end_ms = entry['end_ms']
             
             if wav_duration is None:
-                sync_entry = SyncEntry(
-                    index=entry['index'],
-                    start_ms=entry['start_ms'],
-                    original_end_ms=entry['end_ms'],
-                    wav_duration_ms=0,
-                    synced_end_ms=entry['end_ms'],
-                    text=entry['text'],
-                    wav_filename=wav_filename,
-                    status='missing',
-                    diff_ms=0
-                )
+                wav_duration = diff = 0
+                synced_end = end_ms
+                status = 'missing'
             else:
-                original_duration = entry['end_ms'] - entry['start_ms']
-                diff = wav_duration - original_duration
-                synced_end = entry['start_ms'] + wav_duration
+                diff = wav_duration - (end_ms - start_ms)
+                synced_end = start_ms + wav_duration
                 
-                if abs(diff) < 100:  # 100ms 미만 차이는 동기화됨
+                if -100 < diff < 100:  # 100ms 미만 차이는 동기화됨
                     status = 'synced'
                 elif diff < 0:
                     status = 'shorter'
                 else:
                     status = 'longer'
-                
-                sync_entry = SyncEntry(
-                    index=entry['index'],
-                    start_ms=entry['start_ms'],
-                    original_end_ms=entry['end_ms'],
-                    wav_duration_ms=wav_duration,
-                    synced_end_ms=synced_end,
-                    text=entry['text'],
-                    wav_filename=wav_filename,
-                    status=status,
-                    diff_ms=diff
-                )
             
-            self.entries.append(sync_entry)
+            append(SyncEntry(
+                entry['index'], start_ms, end_ms, wav_duration, synced_end,
+                entry['text'], f"{tc_filename}.wav", status, diff,
+                tc_display=tc_filename.replace('_', ':')
+            ))
         
         return self.entries
     
     def generate_synced_srt(self) -> str:
         """동기화된 SRT 생성"""
-        srt_content = []
+        parts = []
         
         for entry in self.entries:
-            if entry.status == 'missing':
-                end_ms = entry.original_end_ms
-            else:
-                end_ms = entry.synced_end_ms
-            
-            srt_block = f"{entry.index}\n"
-            srt_block += f"{self._ms_to_srt_time(entry.start_ms)} --> {self._ms_to_srt_time(end_ms)}\n"
-            srt_block += f"{entry.text}\n"
-            
-            srt_content.append(srt_block)
+            start, end = self._srt_times(entry)
+            parts.extend((str(entry.index), '\n', start, ' --> ', end, '\n', entry.text, '\n\n'))
         
-        return '\n'.join(srt_content)
+        # 마지막 블록 뒤에는 빈 줄 없음
+        if parts:
+            parts[-1] = '\n'
+        return ''.join(parts)
     
     def save_synced_srt(self, output_path: str):
         """동기화된 SRT 저장"""
@@ -187,18 +291,14 @@ class SRTSync:
     
     def get_summary(self) -> dict:
         """분석 결과 요약"""
-        total = len(self.entries)
-        synced = sum(1 for e in self.entries if e.status == 'synced')
-        shorter = sum(1 for e in self.entries if e.status == 'shorter')
-        longer = sum(1 for e in self.entries if e.status == 'longer')
-        missing = sum(1 for e in self.entries if e.status == 'missing')
+        counts = Counter(e.status for e in self.entries)
         
         return {
-            'total': total,
-            'synced': synced,
-            'shorter': shorter,
-            'longer': longer,
-            'missing': missing
+            'total': len(self.entries),
+            'synced': counts['synced'],
+            'shorter': counts['shorter'],
+            'longer': counts['longer'],
+            'missing': counts['missing']
         }
     
     def set_fps(self, fps: float):
@@ -210,47 +310,48 @@ class SRTSync:
         """entries의 별칭 (호환성)"""
         return self.entries
     
+    def _report_rows(self) -> List[tuple]:
+        """리포트 행 (번호, 타임코드, 원본길이, WAV길이, 차이, 상태) 리스트"""
+        return [
+            (
+                entry.index,
+                self._tc_display(entry),
+                entry.original_end_ms - entry.start_ms,
+                entry.wav_duration_ms,
+                entry.diff_ms,
+                _STATUS_DISPLAY.get(entry.status, entry.status)
+            )
+            for entry in self.entries
+        ]
+    
     def save_report_xlsx(self, output_path: str):
         """XLSX 리포트 저장"""
-        try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment, PatternFill
-            
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "동기화 리포트"
-            
-            # 헤더
-            headers = ["#", "타임코드", "원본길이(ms)", "WAV길이(ms)", "차이(ms)", "상태"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal='center')
-            
-            # 데이터
-            for row, entry in enumerate(self.entries, 2):
-                ws.cell(row=row, column=1, value=entry.index)
-                ws.cell(row=row, column=2, value=self._ms_to_filename_tc(entry.start_ms).replace('_', ':'))
-                ws.cell(row=row, column=3, value=entry.original_end_ms - entry.start_ms)
-                ws.cell(row=row, column=4, value=entry.wav_duration_ms)
-                ws.cell(row=row, column=5, value=entry.diff_ms)
-                
-                status_map = {'synced': 'OK', 'shorter': '여유', 'longer': '초과', 'missing': '누락'}
-                ws.cell(row=row, column=6, value=status_map.get(entry.status, entry.status))
-            
-            wb.save(output_path)
-            return True
-        except Exception:
-            return False
+        return _write_xlsx_report(output_path, self._report_rows())
+    
+    def save_report_xlsx_async(self, output_path: str) -> Future:
+        """XLSX 리포트를 별도 프로세스에서 저장 (UI 블로킹 방지)
+        
+        Returns:
+            결과가 save_report_xlsx 와 같은 bool 인 Future
+        """
+        return _submit_report(output_path, self._report_rows())
+    
+    def save_report_csv(self, output_path: str):
+        """CSV 리포트 저장 (XLSX와 같은 열, openpyxl 불필요)"""
+        # utf-8-sig: Excel에서 한글이 깨지지 않도록 BOM 포함
+        with open(output_path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(_REPORT_HEADERS)
+            writer.writerows(self._report_rows())
+        return True
     
     def save_report_txt(self, output_path: str):
         """TXT 리포트 저장"""
         lines = ["동기화 리포트", "=" * 50, ""]
         
         for entry in self.entries:
-            tc = self._ms_to_filename_tc(entry.start_ms).replace('_', ':')
-            status_map = {'synced': 'OK', 'shorter': '여유', 'longer': '초과', 'missing': '누락'}
-            status = status_map.get(entry.status, entry.status)
+            tc = self._tc_display(entry)
+            status = _STATUS_DISPLAY.get(entry.status, entry.status)
             
             lines.append(f"#{entry.index} [{tc}] {status}")
             lines.append(f"  원본: {entry.original_end_ms - entry.start_ms}ms, WAV: {entry.wav_duration_ms}ms, 차이: {entry.diff_ms}ms")
@@ -1,6 +1,8 @@
 # core/tts/__init__.py
 # TTS 모듈
 
+import os
+
 from .base_engine import (
     BaseTTSEngine,
     EngineType,
@@ -35,6 +37,9 @@ def initialize_tts_engines(client_id: str = "", client_secret: str = "",
     if enable_openvoice:
         openvoice = OpenVoiceEngine()
         available, _ = openvoice.is_available()
+        # 설치되어 있으면 모델을 백그라운드에서 미리 로드 (ADFLOW_OPENVOICE_PRELOAD=0으로 끔)
+        if available and os.environ.get("ADFLOW_OPENVOICE_PRELOAD", "1") != "0":
+            openvoice.start_preload()
         # 설치 여부와 관계없이 등록 (UI에서 상태 표시)
         manager.register_engine(openvoice)
 
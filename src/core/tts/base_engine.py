@@ -1,10 +1,17 @@
 # core/tts/base_engine.py
 # TTS 엔진 추상 기본 클래스
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Sequence, Tuple
+
+# EngineCapabilities.supported_formats 기본값
+_DEFAULT_FORMATS = ("wav",)
+
+# is_available_cached 결과 유지 시간 (초)
+AVAILABILITY_TTL = 30.0
 
 
 class EngineType(Enum):
@@ -14,7 +21,7 @@ class EngineType(Enum):
     LOCAL_CLONE = "clone"    # OpenVoice 등 클로닝 지원 로컬 엔진
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VoiceInfo:
     """음성 정보 (엔진 내부용)"""
     id: str                          # 음성 ID (예: "vdain", "vyuna")
@@ -27,7 +34,7 @@ class VoiceInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineCapabilities:
     """엔진 기능 정보"""
     engine_type: EngineType
@@ -37,10 +44,10 @@ class EngineCapabilities:
     requires_gpu: bool = False           # GPU 필요 여부
     requires_api_key: bool = False       # API 키 필요 여부
     max_text_length: int = 5000          # 최대 텍스트 길이
-    supported_formats: List[str] = field(default_factory=lambda: ["wav"])
+    supported_formats: List[str] = field(default_factory=lambda: list(_DEFAULT_FORMATS))
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSRequest:
     """TTS 생성 요청"""
     text: str
@@ -54,7 +61,7 @@ class TTSRequest:
     format: str = "wav"
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSResult:
     """TTS 생성 결과"""
     success: bool
@@ -69,8 +76,11 @@ class BaseTTSEngine(ABC):
     모든 TTS 엔진은 이 클래스를 상속받아 구현합니다.
     """
 
+    __slots__ = ('_is_initialized', '_availability_cache', 'on_progress', 'on_error')
+
     def __init__(self):
         self._is_initialized = False
+        self._availability_cache: Optional[Tuple[float, tuple]] = None
         self.on_progress: Optional[Callable[[int, int, str], None]] = None
         self.on_error: Optional[Callable[[str, str], None]] = None
 
@@ -92,8 +102,8 @@ class BaseTTSEngine(ABC):
         pass
 
     @abstractmethod
-    def get_voices(self) -> List[VoiceInfo]:
-        """사용 가능한 음성 목록 반환"""
+    def get_voices(self) -> Sequence[VoiceInfo]:
+        """사용 가능한 음성 목록 반환 (읽기 전용으로 취급)"""
         pass
 
     @abstractmethod
@@ -108,6 +118,25 @@ class BaseTTSEngine(ABC):
         """
         pass
 
+    def generate_many(self, requests: List[TTSRequest],
+                      on_result: Optional[Callable[[int, TTSResult], None]] = None) -> List[TTSResult]:
+        """여러 요청 일괄 생성 (기본: 순차 처리, 네트워크 엔진은 오버라이드)
+
+        Args:
+            requests: TTS 생성 요청 목록
+            on_result: 항목 완료 시 호출되는 콜백 (요청 인덱스, 결과)
+
+        Returns:
+            List[TTSResult]: 요청 순서와 같은 순서의 결과 목록
+        """
+        results = []
+        for i, request in enumerate(requests):
+            result = self.generate(request)
+            if on_result:
+                on_result(i, result)
+            results.append(result)
+        return results
+
     @abstractmethod
     def is_available(self) -> tuple:
         """엔진 사용 가능 여부 확인
@@ -117,6 +146,20 @@ class BaseTTSEngine(ABC):
         """
         pass
 
+    def is_available_cached(self, ttl: float = AVAILABILITY_TTL) -> tuple:
+        """is_available 결과를 ttl초 동안 재사용 (생성 루프 등 반복 호출용)"""
+        now = time.monotonic()
+        cache = self._availability_cache
+        if cache is not None and now - cache[0] < ttl:
+            return cache[1]
+        result = self.is_available()
+        self._availability_cache = (now, result)
+        return result
+
+    def invalidate_availability(self):
+        """사용 가능 여부 캐시 초기화 (인증 정보/설치 상태 변경 시)"""
+        self._availability_cache = None
+
     def initialize(self) -> bool:
         """엔진 초기화 (필요한 경우 오버라이드)
 
@@ -129,6 +172,7 @@ class BaseTTSEngine(ABC):
     def shutdown(self):
         """엔진 종료 (필요한 경우 오버라이드)"""
         self._is_initialized = False
+        self._availability_cache = None
 
     @property
     def is_initialized(self) -> bool:
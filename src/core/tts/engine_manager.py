@@ -2,7 +2,8 @@
 # TTS 엔진 통합 관리자
 
 import os
-from typing import Dict, List, Optional, Callable
+import threading
+from typing import Dict, List, Optional, Callable, Tuple
 
 from .base_engine import BaseTTSEngine, TTSRequest, TTSResult, EngineCapabilities
 from .voice_profile import VoiceProfile, VoiceProfileManager, TTSSettings
@@ -12,25 +13,32 @@ class TTSEngineManager:
     """TTS 엔진 통합 관리자
 
     여러 TTS 엔진을 통합 관리하고, 음성 프로파일을 관리합니다.
+    앱 전역 인스턴스는 get_tts_manager()로 얻습니다.
     """
 
-    _instance = None
-
-    def __new__(cls):
-        """싱글톤 패턴"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    __slots__ = (
+        '_engines', '_engine_list', '_cloning_engine_ids', '_cloning_engine_list', '_default_engine_id', '_default_engine',
+        '_current_settings', '_speaker_cache', '_voice_cache', '_config_dir',
+        '_profile_manager', 'on_engine_status_changed', '_last_clone_error',
+    )
 
     def __init__(self):
-        if self._initialized:
-            return
-
         self._engines: Dict[str, BaseTTSEngine] = {}
+        # 클로닝 지원 엔진 ID (등록 순서 유지, 값은 사용하지 않음)
+        self._cloning_engine_ids: Dict[str, None] = {}
+        # get_all_engines / get_cloning_engines 결과 (등록/해제 시 무효화)
+        self._engine_list: Optional[Tuple[BaseTTSEngine, ...]] = None
+        self._cloning_engine_list: Optional[Tuple[BaseTTSEngine, ...]] = None
         self._default_engine_id: str = "clova"
+        # 기본 엔진 참조 (등록/해제/기본 엔진 변경 시 갱신)
+        self._default_engine: Optional[BaseTTSEngine] = None
         self._current_settings = TTSSettings()
 
+        # get_settings_dict용 (voice_id, speaker) 캐시 - 프로파일 변경 시 무효화
+        self._speaker_cache: Optional[Tuple[str, str]] = None
+        # generate용 (voice_id, 엔진, 엔진 내부 음성 ID) 캐시 - 같은 음성 연속 생성 시 조회 생략
+        self._voice_cache: Optional[Tuple[str, BaseTTSEngine, str]] = None
+
         # 설정 디렉토리
         self._config_dir = os.path.expanduser("~/.adflow")
         os.makedirs(self._config_dir, exist_ok=True)
@@ -44,8 +52,6 @@ class TTSEngineManager:
         # 에러 추적
         self._last_clone_error: Optional[str] = None
 
-        self._initialized = True
-
     def get_last_clone_error(self) -> Optional[str]:
         """마지막 클로닝 에러 메시지 반환"""
         return self._last_clone_error
@@ -63,6 +69,16 @@ class TTSEngineManager:
         """
         engine_id = engine.engine_id
         self._engines[engine_id] = engine
+        self._engine_list = None
+        self._cloning_engine_list = None
+        self._invalidate_voice_caches()
+        if engine_id == self._default_engine_id:
+            self._default_engine = engine
+
+        if engine.supports_cloning():
+            self._cloning_engine_ids[engine_id] = None
+        else:
+            self._cloning_engine_ids.pop(engine_id, None)
 
         # 엔진의 음성들을 프로파일로 등록
         self._register_engine_voices(engine)
@@ -70,23 +86,27 @@ class TTSEngineManager:
         return True
 
     def _register_engine_voices(self, engine: BaseTTSEngine):
-        """엔진의 음성들을 프로파일로 등록"""
-        # 기존 프로파일 제거
-        self._profile_manager.clear_engine_profiles(engine.engine_id)
-
-        # 새 프로파일 등록
-        for voice in engine.get_voices():
-            profile = VoiceProfile(
-                id=f"{engine.engine_id}.{voice.id}",
+        """엔진의 음성들을 프로파일로 등록 (기존 프로파일은 교체)"""
+        engine_id = engine.engine_id
+        prefix = f"{engine_id}."
+        self._profile_manager.replace_engine_profiles(engine_id, [
+            VoiceProfile(
+                id=prefix + voice.id,
                 name=voice.name,
-                engine_id=engine.engine_id,
+                engine_id=engine_id,
                 gender=voice.gender,
                 language=voice.language,
                 style=voice.style,
                 supports_emotion=voice.supports_emotion,
                 metadata=voice.metadata
             )
-            self._profile_manager.register_profile(profile)
+            for voice in engine.get_voices()
+        ])
+
+    def _invalidate_voice_caches(self):
+        """엔진/프로파일/설정 변경 시 음성 조회 캐시 초기화"""
+        self._speaker_cache = None
+        self._voice_cache = None
 
     def unregister_engine(self, engine_id: str) -> bool:
         """엔진 등록 해제"""
@@ -94,7 +114,13 @@ class TTSEngineManager:
             engine = self._engines[engine_id]
             engine.shutdown()
             del self._engines[engine_id]
+            self._cloning_engine_ids.pop(engine_id, None)
+            self._engine_list = None
+            self._cloning_engine_list = None
+            if engine_id == self._default_engine_id:
+                self._default_engine = None
             self._profile_manager.clear_engine_profiles(engine_id)
+            self._invalidate_voice_caches()
             return True
         return False
 
@@ -102,13 +128,15 @@ class TTSEngineManager:
         """엔진 조회"""
         return self._engines.get(engine_id)
 
-    def get_all_engines(self) -> List[BaseTTSEngine]:
+    def get_all_engines(self) -> Tuple[BaseTTSEngine, ...]:
         """전체 엔진 목록"""
-        return list(self._engines.values())
+        if self._engine_list is None:
+            self._engine_list = tuple(self._engines.values())
+        return self._engine_list
 
     def get_available_engines(self) -> List[BaseTTSEngine]:
         """사용 가능한 엔진 목록"""
-        return [e for e in self._engines.values() if e.is_available()[0]]
+        return [e for e in self._engines.values() if e.is_available_cached()[0]]
 
     # === 기본 엔진 ===
 
@@ -120,10 +148,11 @@ class TTSEngineManager:
     def default_engine_id(self, engine_id: str):
         if engine_id in self._engines:
             self._default_engine_id = engine_id
+            self._default_engine = self._engines[engine_id]
 
     def get_default_engine(self) -> Optional[BaseTTSEngine]:
         """기본 엔진 반환"""
-        return self._engines.get(self._default_engine_id)
+        return self._default_engine
 
     # === TTS 설정 ===
 
@@ -134,16 +163,19 @@ class TTSEngineManager:
     @current_settings.setter
     def current_settings(self, settings: TTSSettings):
         self._current_settings = settings
+        self._invalidate_voice_caches()
 
     def get_settings_dict(self) -> dict:
         """현재 설정을 딕셔너리로 반환 (기존 voice_settings 호환)"""
-        profile = self._profile_manager.get_profile(self._current_settings.voice_id)
-        if profile:
-            # voice_id에서 실제 음성 ID 추출 (예: "clova.vdain" -> "vdain")
-            voice_id_parts = self._current_settings.voice_id.split('.')
-            speaker = voice_id_parts[-1] if len(voice_id_parts) > 1 else voice_id_parts[0]
+        # UI가 current_settings 필드를 직접 바꾸므로 voice_id 값으로 캐시 적중 판단
+        voice_id = self._current_settings.voice_id
+        cache = self._speaker_cache
+        if cache is not None and cache[0] == voice_id:
+            speaker = cache[1]
         else:
-            speaker = "vdain"
+            profile = self._profile_manager.get_profile(voice_id)
+            speaker = profile.engine_prefix_and_id[1] if profile else "vdain"
+            self._speaker_cache = (voice_id, speaker)
 
         return {
             'speaker': speaker,
@@ -160,7 +192,7 @@ class TTSEngineManager:
     def profile_manager(self) -> VoiceProfileManager:
         return self._profile_manager
 
-    def get_all_profiles(self) -> List[VoiceProfile]:
+    def get_all_profiles(self) -> Tuple[VoiceProfile, ...]:
         """전체 음성 프로파일"""
         return self._profile_manager.get_all_profiles()
 
@@ -183,53 +215,104 @@ class TTSEngineManager:
         Returns:
             TTSResult: 생성 결과
         """
+        prepared = self._prepare_requests([(text, output_path)], voice_id, kwargs)
+        if isinstance(prepared, TTSResult):
+            return prepared
+
+        engine, requests = prepared
+        return engine.generate(requests[0])
+
+    def generate_many(self, items: List[Tuple[str, str]], voice_id: str = None,
+                      on_result: Optional[Callable[[int, TTSResult], None]] = None,
+                      **kwargs) -> List[TTSResult]:
+        """여러 텍스트 일괄 TTS 생성
+
+        Args:
+            items: (텍스트, 출력 파일 경로) 목록
+            voice_id: 음성 ID (None이면 현재 설정 사용)
+            on_result: 항목 완료 시 호출되는 콜백 (항목 인덱스, 결과)
+            **kwargs: 추가 옵션 (speed, pitch, volume, emotion 등)
+
+        Returns:
+            List[TTSResult]: items와 같은 순서의 생성 결과
+        """
+        prepared = self._prepare_requests(items, voice_id, kwargs)
+        if isinstance(prepared, TTSResult):
+            return [prepared] * len(items)
+
+        engine, requests = prepared
+        return engine.generate_many(requests, on_result=on_result)
+
+    def _prepare_requests(self, items: List[Tuple[str, str]], voice_id: Optional[str], kwargs: dict):
+        """음성 ID로 엔진을 찾고 요청 목록 생성
+
+        Returns:
+            (엔진, 요청 목록) 또는 실패 시 TTSResult
+        """
         # 음성 ID 결정
         if voice_id is None:
             voice_id = self._current_settings.voice_id
 
-        # 프로파일에서 엔진 찾기
-        profile = self._profile_manager.get_profile(voice_id)
-        if not profile:
-            return TTSResult(
-                success=False,
-                error_message=f"음성을 찾을 수 없습니다: {voice_id}"
-            )
-
-        engine = self._engines.get(profile.engine_id)
-        if not engine:
-            return TTSResult(
-                success=False,
-                error_message=f"엔진을 찾을 수 없습니다: {profile.engine_id}"
-            )
+        cache = self._voice_cache
+        if cache is not None and cache[0] == voice_id:
+            _, engine, actual_voice_id = cache
+        else:
+            # 프로파일에서 엔진 찾기
+            profile = self._profile_manager.get_profile(voice_id)
+            if not profile:
+                return TTSResult(
+                    success=False,
+                    error_message=f"음성을 찾을 수 없습니다: {voice_id}"
+                )
+
+            if profile.engine_id == self._default_engine_id:
+                engine = self._default_engine
+            else:
+                engine = self._engines.get(profile.engine_id)
+            if not engine:
+                return TTSResult(
+                    success=False,
+                    error_message=f"엔진을 찾을 수 없습니다: {profile.engine_id}"
+                )
+
+            actual_voice_id = profile.engine_prefix_and_id[1]
+            self._voice_cache = (voice_id, engine, actual_voice_id)
 
         # 사용 가능 여부 확인
-        available, message = engine.is_available()
+        available, message = engine.is_available_cached()
         if not available:
             return TTSResult(success=False, error_message=message)
 
         # 요청 생성
-        # voice_id에서 실제 음성 ID 추출
-        voice_id_parts = voice_id.split('.')
-        actual_voice_id = voice_id_parts[-1] if len(voice_id_parts) > 1 else voice_id_parts[0]
-
-        request = TTSRequest(
-            text=text,
-            voice_id=actual_voice_id,
-            output_path=output_path,
-            speed=kwargs.get('speed', self._current_settings.speed),
-            pitch=kwargs.get('pitch', self._current_settings.pitch),
-            volume=kwargs.get('volume', self._current_settings.volume),
-            emotion=kwargs.get('emotion', self._current_settings.emotion),
-            emotion_strength=kwargs.get('emotion_strength', self._current_settings.emotion_strength)
-        )
 
-        return engine.generate(request)
+        speed = kwargs.get('speed', self._current_settings.speed)
+        pitch = kwargs.get('pitch', self._current_settings.pitch)
+        volume = kwargs.get('volume', self._current_settings.volume)
+        emotion = kwargs.get('emotion', self._current_settings.emotion)
+        emotion_strength = kwargs.get('emotion_strength', self._current_settings.emotion_strength)
+
+        requests = [
+            TTSRequest(
+                text=text,
+                voice_id=actual_voice_id,
+                output_path=output_path,
+                speed=speed,
+                pitch=pitch,
+                volume=volume,
+                emotion=emotion,
+                emotion_strength=emotion_strength
+            )
+            for text, output_path in items
+        ]
+        return engine, requests
 
     # === 클로닝 ===
 
-    def get_cloning_engines(self) -> List[BaseTTSEngine]:
+    def get_cloning_engines(self) -> Tuple[BaseTTSEngine, ...]:
         """클로닝 지원 엔진 목록"""
-        return [e for e in self._engines.values() if e.supports_cloning()]
+        if self._cloning_engine_list is None:
+            self._cloning_engine_list = tuple(self._engines[eid] for eid in self._cloning_engine_ids)
+        return self._cloning_engine_list
 
     def clone_voice(self, reference_audio: str, voice_name: str,
                     engine_id: str = None, tags: List[str] = None) -> Optional[VoiceProfile]:
@@ -276,6 +359,7 @@ class TTSEngineManager:
         )
 
         self._profile_manager.register_custom_profile(profile)
+        self._invalidate_voice_caches()
         return profile
 
     def delete_cloned_voice(self, profile_id: str) -> bool:
@@ -287,20 +371,23 @@ class TTSEngineManager:
         # 엔진에서도 삭제
         engine = self._engines.get(profile.engine_id)
         if engine and engine.supports_cloning():
-            voice_id = profile_id.split('.')[-1]
-            engine.delete_cloned_voice(voice_id)
+            engine.delete_cloned_voice(profile.engine_prefix_and_id[1])
 
         # 프로파일 삭제
+        self._invalidate_voice_caches()
         return self._profile_manager.delete_custom_profile(profile_id)
 
 
 # 전역 인스턴스
 _manager: Optional[TTSEngineManager] = None
+_manager_lock = threading.Lock()
 
 
 def get_tts_manager() -> TTSEngineManager:
-    """TTS 엔진 매니저 싱글톤 인스턴스 반환"""
+    """TTS 엔진 매니저 싱글톤 인스턴스 반환 (스레드 안전)"""
     global _manager
     if _manager is None:
-        _manager = TTSEngineManager()
+        with _manager_lock:
+            if _manager is None:
+                _manager = TTSEngineManager()
     return _manager
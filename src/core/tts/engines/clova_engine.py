@@ -2,27 +2,77 @@
 # NAVER CLOVA Voice TTS 엔진
 
 import os
-import ssl
-import urllib.request
+import time
+import shutil
+import hashlib
+import threading
 import urllib.parse
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
 
 from ..base_engine import (
     BaseTTSEngine, EngineType, EngineCapabilities,
     VoiceInfo, TTSRequest, TTSResult
 )
+from ..._https_pool import MAX_RETRIES, RETRY_BACKOFF, RETRY_STATUSES, RequestThrottle, post_form
 
-# SSL 인증서 우회 (macOS 호환성)
-ssl._create_default_https_context = ssl._create_unverified_context
+# 캐시할 폼 접두부 최대 개수 (음성/옵션 조합 수)
+_FORM_PREFIX_LIMIT = 64
+
+# 응답 본문 스트리밍 단위
+_STREAM_CHUNK_SIZE = 1 << 16
+
+# 연결 테스트용 요청 본문 (고정값이므로 한 번만 인코딩)
+_TEST_BODY = urllib.parse.urlencode({
+    "speaker": "nara", "text": "테스트",
+    "volume": 0, "speed": 0, "pitch": 0, "format": "wav",
+}).encode('ascii')
+
+# 이미 생성을 확인한 디렉토리 (같은 폴더에 반복 출력 시 makedirs 생략)
+_ensured_dirs = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: str, force: bool = False):
+    """디렉토리가 없으면 생성 (확인된 경로는 다시 검사하지 않음)"""
+    if not path:
+        return
+    if not force and path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    with _ensured_dirs_lock:
+        _ensured_dirs.add(path)
+
+
+def _open_output(path: str):
+    """쓰기용 파일 열기 - 확인 후 폴더가 지워졌으면 다시 만들고 재시도"""
+    try:
+        return open(path, 'wb')
+    except FileNotFoundError:
+        _ensure_dir(os.path.dirname(path), force=True)
+        return open(path, 'wb')
 
 
 class CLOVAEngine(BaseTTSEngine):
     """NAVER CLOVA Voice TTS 엔진"""
 
+    __slots__ = (
+        '_client_id', '_client_secret', '_request_headers', 'api_delay', '_throttle',
+        '_cache_dir', '_cache_index', '_cache_bytes', '_cache_lock', '_form_prefixes',
+    )
+
     API_URL = "https://naveropenapi.apigw.ntruss.com/tts-premium/v1/tts"
 
-    # 기본 음성 목록
-    DEFAULT_VOICES = [
+    # 생성 결과 디스크 캐시 한도 (LRU 제거)
+    CACHE_MAX_BYTES = 200 * 1024 * 1024
+    CACHE_MAX_ENTRIES = 2000
+
+    # 일괄 생성 시 동시 요청 수 (계정별 호출 한도 고려)
+    BATCH_CONCURRENCY = 4
+
+    # 기본 음성 목록 (불변 - get_voices가 그대로 반환)
+    DEFAULT_VOICES: Tuple[VoiceInfo, ...] = (
         VoiceInfo(
             id="vdain", name="다인", gender="female",
             style="차분한 톤", supports_emotion=True,
@@ -73,13 +123,26 @@ class CLOVAEngine(BaseTTSEngine):
             style="밝은 톤", supports_emotion=False,
             description="밝은 여성 음성"
         ),
-    ]
+    )
 
-    def __init__(self, client_id: str = "", client_secret: str = ""):
+    def __init__(self, client_id: str = "", client_secret: str = "",
+                 cache_dir: Optional[str] = None):
         super().__init__()
         self._client_id = client_id
         self._client_secret = client_secret
+        self._request_headers = self._build_headers()
         self.api_delay = 0.3  # API 호출 간 대기 시간 (초)
+        # 일괄 생성 시 요청 시작 간격 제한 (api_delay 간격 유지)
+        self._throttle = RequestThrottle()
+
+        # 동일 요청 재생성 방지용 캐시 (키 -> 파일 크기, 최근 사용이 뒤)
+        self._cache_dir = cache_dir or os.path.expanduser("~/.adflow/tts_cache")
+        self._cache_index: Optional[OrderedDict] = None
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
+
+        # 음성/옵션 조합 -> 인코딩된 폼 접두부 (텍스트 제외)
+        self._form_prefixes: dict = {}
 
     @property
     def engine_id(self) -> str:
@@ -101,13 +164,15 @@ class CLOVAEngine(BaseTTSEngine):
             supported_formats=["wav", "mp3"]
         )
 
-    def get_voices(self) -> List[VoiceInfo]:
-        return self.DEFAULT_VOICES.copy()
+    def get_voices(self) -> Tuple[VoiceInfo, ...]:
+        return self.DEFAULT_VOICES
 
     def set_credentials(self, client_id: str, client_secret: str):
         """API 인증 정보 설정"""
         self._client_id = client_id
         self._client_secret = client_secret
+        self._request_headers = self._build_headers()
+        self.invalidate_availability()
 
     @property
     def has_credentials(self) -> bool:
@@ -122,66 +187,68 @@ class CLOVAEngine(BaseTTSEngine):
 
     def generate(self, request: TTSRequest) -> TTSResult:
         """TTS 생성"""
+        return self._generate(request)
+
+    def _generate(self, request: TTSRequest, throttle: Optional[RequestThrottle] = None) -> TTSResult:
+        """TTS 생성 (throttle이 주어지면 API 호출 전에 요청 간격을 맞춤)"""
         if not self.has_credentials:
             return TTSResult(
                 success=False,
                 error_message="API 키가 설정되지 않았습니다"
             )
 
-        # 요청 데이터 구성
-        enc_text = urllib.parse.quote(request.text)
-
-        params = [
-            f"speaker={request.voice_id}",
-            f"text={enc_text}",
-            f"volume={request.volume}",
-            f"speed={request.speed}",
-            f"pitch={request.pitch}",
-            f"format={request.format}"
-        ]
-
-        # 감정 설정 (지원 음성만)
-        if request.emotion > 0:
-            params.append(f"emotion={request.emotion}")
-            params.append(f"emotion-strength={request.emotion_strength}")
+        # 같은 파라미터로 생성한 적이 있으면 API 호출 없이 복사
+        cache_key = self._cache_key(request)
+        if self._cache_fetch(cache_key, request):
+            return TTSResult(success=True, output_path=request.output_path)
 
-        data = "&".join(params)
-
-        # API 요청
-        http_request = urllib.request.Request(self.API_URL)
-        http_request.add_header("X-NCP-APIGW-API-KEY-ID", self._client_id)
-        http_request.add_header("X-NCP-APIGW-API-KEY", self._client_secret)
-        http_request.add_header("Content-Type", "application/x-www-form-urlencoded")
+        # 요청 데이터 구성 (텍스트 외 파라미터는 캐시된 접두부 사용, 인코딩 후에는 ASCII만 남음)
+        data = (
+            self._form_prefix(request) + "&text="
+            + urllib.parse.quote_from_bytes(request.text.encode('utf-8'), safe='')
+        ).encode('ascii')
 
         try:
-            response = urllib.request.urlopen(
-                http_request,
-                data=data.encode('utf-8'),
-                timeout=30
-            )
-
-            if response.getcode() == 200:
-                # 출력 디렉토리 생성
-                os.makedirs(os.path.dirname(request.output_path), exist_ok=True)
-
-                with open(request.output_path, 'wb') as f:
-                    f.write(response.read())
-
-                return TTSResult(
-                    success=True,
-                    output_path=request.output_path
-                )
-            else:
-                return TTSResult(
-                    success=False,
-                    error_message=f"HTTP {response.getcode()}"
-                )
-
-        except urllib.error.HTTPError as e:
-            error_msg = f"HTTP 오류: {e.code}"
-            if e.code == 401:
+            # 출력 디렉토리 생성 (실패 시 API 호출 없이 종료)
+            _ensure_dir(os.path.dirname(request.output_path))
+
+            if throttle is not None:
+                throttle.wait(self.api_delay)
+
+            # 일시적 오류(요청 한도 초과, 서버 오류)는 간격을 늘려 재시도
+            for attempt in range(MAX_RETRIES + 1):
+                response = post_form(self.API_URL, self._request_headers, data, timeout=30)
+
+                if response.status == 200:
+                    # 응답 본문을 메모리에 모으지 않고 청크 단위로 기록
+                    try:
+                        with _open_output(request.output_path) as f:
+                            shutil.copyfileobj(response, f, _STREAM_CHUNK_SIZE)
+                    except BaseException:
+                        # 중간에 끊긴 파일이 정상 파일로 보이지 않도록 제거
+                        try:
+                            os.remove(request.output_path)
+                        except OSError:
+                            pass
+                        raise
+
+                    self._cache_store(cache_key, request)
+
+                    return TTSResult(
+                        success=True,
+                        output_path=request.output_path
+                    )
+
+                # 연결 재사용을 위해 오류 응답 본문도 끝까지 읽음
+                response.read()
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+                time.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+            error_msg = f"HTTP 오류: {response.status}"
+            if response.status == 401:
                 error_msg = "인증 실패: API 키를 확인하세요"
-            elif e.code == 429:
+            elif response.status == 429:
                 error_msg = "요청 한도 초과"
             return TTSResult(success=False, error_message=error_msg)
 
@@ -191,6 +258,171 @@ class CLOVAEngine(BaseTTSEngine):
                 error_message=f"오류: {str(e)}"
             )
 
+    def _form_prefix(self, request: TTSRequest) -> str:
+        """텍스트를 제외한 폼 파라미터 문자열 (옵션 조합별로 한 번만 생성)"""
+        key = (request.voice_id, request.volume, request.speed, request.pitch,
+               request.format, request.emotion, request.emotion_strength)
+        prefix = self._form_prefixes.get(key)
+        if prefix is None:
+            params = {
+                "speaker": request.voice_id,
+                "volume": request.volume,
+                "speed": request.speed,
+                "pitch": request.pitch,
+                "format": request.format,
+            }
+
+            # 감정 설정 (지원 음성만)
+            if request.emotion > 0:
+                params["emotion"] = request.emotion
+                params["emotion-strength"] = request.emotion_strength
+
+            if len(self._form_prefixes) >= _FORM_PREFIX_LIMIT:
+                self._form_prefixes.clear()
+            prefix = self._form_prefixes[key] = urllib.parse.urlencode(params)
+        return prefix
+
+    def generate_many(self, requests: List[TTSRequest],
+                      on_result: Optional[Callable[[int, TTSResult], None]] = None) -> List[TTSResult]:
+        """여러 요청을 동시에 생성 (최대 BATCH_CONCURRENCY개)
+
+        스레드마다 keep-alive 연결을 따로 쓰므로 응답 대기 시간이 겹쳐진다.
+        API 요청 시작 간격은 api_delay 이상으로 유지한다 (캐시 적중은 제외).
+        on_result는 완료 순서대로 호출한 스레드에서 실행된다.
+        """
+        results: List[Optional[TTSResult]] = [None] * len(requests)
+        if not requests:
+            return []
+
+        workers = min(self.BATCH_CONCURRENCY, len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._generate, r, self._throttle): i for i, r in enumerate(requests)}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                if on_result:
+                    on_result(i, results[i])
+
+        return results
+
+    def _build_headers(self) -> dict:
+        """API 요청 헤더 (인증 정보 설정 시 한 번만 생성)"""
+        return {
+            "X-NCP-APIGW-API-KEY-ID": self._client_id,
+            "X-NCP-APIGW-API-KEY": self._client_secret,
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+    # ── 생성 결과 캐시 ──
+
+    def _cache_key(self, request: TTSRequest) -> str:
+        """요청 파라미터로 캐시 키(SHA-256) 생성"""
+        raw = (
+            f"{request.voice_id}|{request.text}|{request.speed}|{request.pitch}|"
+            f"{request.volume}|{request.emotion}|{request.emotion_strength}|{request.format}"
+        )
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _cache_file(self, key: str, fmt: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}.{fmt}")
+
+    def _load_cache_index(self):
+        """캐시 폴더를 스캔해 인덱스 구성 (수정 시각이 오래된 순)"""
+        index = OrderedDict()
+        total = 0
+        try:
+            entries = [e for e in os.scandir(self._cache_dir)
+                       if e.is_file() and not e.name.endswith(".tmp")]
+        except OSError:
+            entries = []
+
+        stats = []
+        for e in entries:
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            stats.append((st.st_mtime, e.name, st.st_size))
+        stats.sort()
+
+        for _, name, size in stats:
+            index[name] = size
+            total += size
+
+        self._cache_index = index
+        self._cache_bytes = total
+
+    def _cache_fetch(self, key: str, request: TTSRequest) -> bool:
+        """캐시 적중 시 출력 경로로 복사하고 True 반환"""
+        name = f"{key}.{request.format}"
+        path = self._cache_file(key, request.format)
+
+        with self._cache_lock:
+            if self._cache_index is None:
+                self._load_cache_index()
+            if name not in self._cache_index:
+                return False
+            self._cache_index.move_to_end(name)
+
+        try:
+            _ensure_dir(os.path.dirname(request.output_path))
+            try:
+                shutil.copyfile(path, request.output_path)
+            except FileNotFoundError:
+                # 캐시 파일이 없는 경우와 출력 폴더가 지워진 경우 구분
+                if not os.path.exists(path):
+                    raise
+                _ensure_dir(os.path.dirname(request.output_path), force=True)
+                shutil.copyfile(path, request.output_path)
+            # 재시작 후에도 LRU 순서가 유지되도록 수정 시각 갱신
+            os.utime(path)
+            return True
+        except OSError:
+            # 외부에서 지워진 캐시 파일은 인덱스에서 제거
+            with self._cache_lock:
+                size = self._cache_index.pop(name, None)
+                if size is not None:
+                    self._cache_bytes -= size
+            return False
+
+    def _cache_store(self, key: str, request: TTSRequest):
+        """생성된 파일을 캐시에 저장하고 한도를 넘으면 오래된 항목 제거"""
+        name = f"{key}.{request.format}"
+        path = self._cache_file(key, request.format)
+        tmp_path = f"{path}.tmp"
+
+        try:
+            _ensure_dir(self._cache_dir)
+            try:
+                shutil.copyfile(request.output_path, tmp_path)
+            except FileNotFoundError:
+                _ensure_dir(self._cache_dir, force=True)
+                shutil.copyfile(request.output_path, tmp_path)
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except OSError:
+            return
+
+        with self._cache_lock:
+            if self._cache_index is None:
+                self._load_cache_index()
+            old = self._cache_index.pop(name, None)
+            if old is not None:
+                self._cache_bytes -= old
+            self._cache_index[name] = size
+            self._cache_bytes += size
+
+            while self._cache_index and (
+                self._cache_bytes > self.CACHE_MAX_BYTES
+                or len(self._cache_index) > self.CACHE_MAX_ENTRIES
+            ):
+                victim, victim_size = self._cache_index.popitem(last=False)
+                self._cache_bytes -= victim_size
+                try:
+                    os.remove(os.path.join(self._cache_dir, victim))
+                except OSError:
+                    pass
+
     def test_connection(self) -> tuple:
         """API 연결 테스트
 
@@ -200,34 +432,19 @@ class CLOVAEngine(BaseTTSEngine):
         if not self.has_credentials:
             return False, "API 키가 설정되지 않았습니다"
 
-        # 짧은 테스트 요청
-        test_text = "테스트"
-        enc_text = urllib.parse.quote(test_text)
-        data = f"speaker=nara&text={enc_text}&volume=0&speed=0&pitch=0&format=wav"
-
-        http_request = urllib.request.Request(self.API_URL)
-        http_request.add_header("X-NCP-APIGW-API-KEY-ID", self._client_id)
-        http_request.add_header("X-NCP-APIGW-API-KEY", self._client_secret)
-        http_request.add_header("Content-Type", "application/x-www-form-urlencoded")
-
         try:
-            response = urllib.request.urlopen(
-                http_request,
-                data=data.encode('utf-8'),
-                timeout=10
-            )
+            # 짧은 테스트 요청
+            response = post_form(self.API_URL, self._request_headers, _TEST_BODY, timeout=10)
+            response.read()
 
-            if response.getcode() == 200:
+            if response.status == 200:
                 return True, "연결 성공"
-            else:
-                return False, f"HTTP {response.getcode()}"
-
-        except urllib.error.HTTPError as e:
-            if e.code == 401:
+            elif response.status == 401:
                 return False, "인증 실패: API 키를 확인하세요"
-            elif e.code == 429:
+            elif response.status == 429:
                 return False, "요청 한도 초과"
             else:
-                return False, f"HTTP 오류: {e.code}"
+                return False, f"HTTP 오류: {response.status}"
+
         except Exception as e:
             return False, f"연결 오류: {str(e)}"
@@ -2,9 +2,17 @@
 # OpenVoice v2 로컬 TTS 엔진
 
 import os
+import wave
 import shutil
+import hashlib
+import time
 import tempfile
-from typing import List, Optional, Dict
+import threading
+import functools
+import contextlib
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Tuple
 
 from ..base_engine import (
     BaseTTSEngine, EngineType, EngineCapabilities,
@@ -12,6 +20,143 @@ from ..base_engine import (
 )
 
 
+# 중간 WAV 파일 위치 - 리눅스는 RAM 기반 /dev/shm을 사용해 디스크 왕복을 피함
+_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# 로드된 모델 공유 풀 - shutdown 후 엔진을 다시 만들어도 체크포인트를 재로드하지 않음
+# MeloTTS: (언어, 디바이스) -> 모델, ToneColorConverter: (모델 경로, 디바이스) -> 변환기
+_MODEL_POOL: Dict[Tuple[str, str], object] = {}
+_CONVERTER_POOL: Dict[Tuple[str, str], object] = {}
+_POOL_LOCK = threading.Lock()
+
+# 반정밀도 추론 (ADFLOW_FP16=1) - CUDA는 FP16 가중치+autocast, CPU는 BF16 autocast
+_FP16_ENABLED = os.environ.get("ADFLOW_FP16") == "1"
+
+def _concat_wavs(paths: List[str], output_path: str):
+    """같은 포맷의 WAV 파일들을 순서대로 이어 붙여 저장"""
+    with wave.open(output_path, 'wb') as out:
+        for i, path in enumerate(paths):
+            with wave.open(path, 'rb') as src:
+                if i == 0:
+                    out.setparams(src.getparams())
+                out.writeframes(src.readframes(src.getnframes()))
+
+
+# 모델 다운로드 시도 횟수 (받은 파일은 유지되어 재시도 시 이어받음)
+_DOWNLOAD_ATTEMPTS = 3
+
+def _fast_copy(src: str, dst: str):
+    """파일 복사 - 같은 파일시스템이면 하드 링크, 아니면 커널 복사
+
+    복사본은 새로 쓰지 않는 데이터(참조 오디오, 음색 임베딩)에만 사용한다.
+    """
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(src, dst)
+        return
+    except (OSError, AttributeError):
+        pass
+
+    # 리눅스: copy_file_range (btrfs/xfs 등에서는 reflink로 처리됨)
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass
+
+    # 그 외: shutil.copyfile (macOS fcopyfile, 리눅스 sendfile 사용)
+    shutil.copyfile(src, dst)
+
+
+# 음색 임베딩 파일 확장자 (앞쪽 우선 - 이전 버전의 .pth도 읽음)
+_SE_EXTENSIONS = (".safetensors", ".pth")
+
+
+def _find_se_file(base: str) -> Optional[str]:
+    """확장자를 제외한 경로로 저장된 음색 임베딩 파일 찾기"""
+    for ext in _SE_EXTENSIONS:
+        path = base + ext
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _check_openvoice_installed() -> tuple:
+    """OpenVoice/MeloTTS 설치 여부 (find_spec은 sys.path 전체를 뒤지므로 결과 캐시)"""
+    try:
+        import importlib.util
+
+        openvoice_spec = importlib.util.find_spec("openvoice")
+        melo_spec = importlib.util.find_spec("melo")
+
+        if openvoice_spec is None:
+            return (False, "OpenVoice가 설치되지 않음")
+
+        if melo_spec is None:
+            return (False, "MeloTTS가 설치되지 않음")
+
+        return (True, "사용 가능")
+
+    except Exception as e:
+        return (False, f"확인 실패: {str(e)}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _dummy_mecab_tokenize(text: str) -> Tuple[Tuple[str, str], ...]:
+    """더미 MeCab용 토크나이저 - (형태소, 품사) 튜플의 튜플 반환
+
+    한글 음절은 문자 단위 NNG, 영문 연속은 SL, 숫자 연속은 SN,
+    그 외 문자는 한 글자씩 SW로 태깅하고 공백은 건너뛴다.
+    정규식 대신 문자 범위를 직접 검사해 한 번에 훑는다.
+    g2pkk가 같은 구간을 반복 분석하므로 결과를 캐시한다 (불변 튜플).
+    """
+    tokens = []
+    append = tokens.append
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if '가' <= ch <= '힣':
+            # 한글은 NNG(일반명사)로 태깅
+            append((ch, 'NNG'))
+            i += 1
+        elif ch.isascii() and ch.isalpha():
+            # 영문은 SL(외국어)로 태깅
+            j = i + 1
+            while j < n and text[j].isascii() and text[j].isalpha():
+                j += 1
+            append((text[i:j], 'SL'))
+            i = j
+        elif ch.isdecimal():
+            # 숫자는 SN(숫자)로 태깅
+            j = i + 1
+            while j < n and text[j].isdecimal():
+                j += 1
+            append((text[i:j], 'SN'))
+            i = j
+        elif ch.isspace():
+            # 공백은 건너뜀
+            i += 1
+        else:
+            # 특수문자는 SW(기호)로 태깅
+            append((ch, 'SW'))
+            i += 1
+    return tuple(tokens)
+
+
 class OpenVoiceEngine(BaseTTSEngine):
     """OpenVoice v2 로컬 TTS 엔진
 
@@ -24,10 +169,19 @@ class OpenVoiceEngine(BaseTTSEngine):
     - GPU 권장 (CPU에서도 동작 가능하나 느림)
     """
 
+    # sys.modules 패치는 프로세스 전역이므로 인스턴스와 무관하게 한 번만 적용
+    _mecab_patched = False
+
     def __init__(self, models_path: str = None):
         super().__init__()
         self._models_path = models_path or os.path.expanduser("~/.adflow/models/openvoice")
         self._cloned_voices_dir = os.path.join(self._models_path, "cloned_voices")
+        # 참조 오디오 해시별 음색 임베딩 캐시 (같은 파일 재클로닝 시 추출 생략)
+        self._se_cache_dir = os.path.join(self._cloned_voices_dir, "se_cache")
+        # MeloTTS 기본 화자 임베딩 (세션 간 재사용, 확장자 제외 경로)
+        self._source_se_base = os.path.join(self._models_path, "source_se")
+        # (경로, 크기, 수정 시각) -> 참조 오디오 SHA-256
+        self._ref_sha_cache: Dict[Tuple[str, int, int], str] = {}
         self._cloned_voices: Dict[str, VoiceInfo] = {}
 
         # OpenVoice 및 MeloTTS 모듈 (동적 로드)
@@ -36,15 +190,21 @@ class OpenVoiceEngine(BaseTTSEngine):
         self._tts_model = None
         self._se_extractor = None
         self._source_se = None  # 기본 화자 임베딩
+        self._default_speaker_id = None  # MeloTTS 첫 번째 화자 ID
         self._last_error = None  # 마지막 에러 메시지
 
+        # 모델 로드 (백그라운드 선로드 시 첫 생성 대기 시간 단축)
+        self._init_lock = threading.Lock()
+        self._init_thread: Optional[threading.Thread] = None
+
         self._ensure_dirs()
-        self._load_cloned_voices()
+        self._cloned_voices = self._load_cloned_voices()
 
     def _ensure_dirs(self):
         """디렉토리 생성"""
         os.makedirs(self._models_path, exist_ok=True)
         os.makedirs(self._cloned_voices_dir, exist_ok=True)
+        os.makedirs(self._se_cache_dir, exist_ok=True)
 
     def get_last_error(self) -> Optional[str]:
         """마지막 에러 메시지 반환"""
@@ -93,23 +253,15 @@ class OpenVoiceEngine(BaseTTSEngine):
         return voices
 
     def is_available(self) -> tuple:
-        """OpenVoice 사용 가능 여부 확인"""
-        try:
-            import importlib.util
-
-            openvoice_spec = importlib.util.find_spec("openvoice")
-            melo_spec = importlib.util.find_spec("melo")
-
-            if openvoice_spec is None:
-                return (False, "OpenVoice가 설치되지 않음")
+        """OpenVoice 사용 가능 여부 확인 (설치 상태는 프로세스당 한 번만 검사)"""
+        return _check_openvoice_installed()
 
-            if melo_spec is None:
-                return (False, "MeloTTS가 설치되지 않음")
-
-            return (True, "사용 가능")
-
-        except Exception as e:
-            return (False, f"확인 실패: {str(e)}")
+    def invalidate_availability(self):
+        """사용 가능 여부 캐시 초기화 (실행 중 패키지를 설치한 경우)"""
+        import importlib
+        importlib.invalidate_caches()
+        _check_openvoice_installed.cache_clear()
+        super().invalidate_availability()
 
     def _patch_mecab_module(self):
         """mecab 모듈 의존성 우회 패치
@@ -122,7 +274,7 @@ class OpenVoiceEngine(BaseTTSEngine):
         from importlib.machinery import ModuleSpec
 
         # 이미 패치되어 있는지 확인
-        if '_mecab_patched' in dir(self):
+        if OpenVoiceEngine._mecab_patched:
             return
 
         # mecab 더미 모듈 생성 (g2pkk에서 사용하는 모든 인터페이스 구현)
@@ -146,34 +298,7 @@ class OpenVoiceEngine(BaseTTSEngine):
                 """
                 if not text:
                     return []
-
-                import re
-                tokens = []
-
-                # 한글, 영문, 숫자, 기타로 분리
-                # 한글은 문자 단위, 나머지는 연속된 것끼리 묶음
-                pattern = r'([가-힣])|([a-zA-Z]+)|(\d+)|(\s+)|(.)'
-
-                for match in re.finditer(pattern, text):
-                    hangul, alpha, digit, space, other = match.groups()
-
-                    if hangul:
-                        # 한글은 NNG(일반명사)로 태깅
-                        tokens.append((hangul, 'NNG'))
-                    elif alpha:
-                        # 영문은 SL(외국어)로 태깅
-                        tokens.append((alpha, 'SL'))
-                    elif digit:
-                        # 숫자는 SN(숫자)로 태깅
-                        tokens.append((digit, 'SN'))
-                    elif space:
-                        # 공백은 건너뜀
-                        continue
-                    elif other:
-                        # 특수문자는 SW(기호)로 태깅
-                        tokens.append((other, 'SW'))
-
-                return tokens
+                return list(_dummy_mecab_tokenize(text))
 
             def pos(self, text):
                 """형태소 분석 - (형태소, 품사) 튜플 리스트 반환
@@ -233,7 +358,10 @@ class OpenVoiceEngine(BaseTTSEngine):
                 # g2pkk uses mecab.MeCab() (lowercase module, uppercase class)
                 if name == 'MeCab':
                     return DummyMeCabTagger
-                return DummyMeCab(f"{self.__name__}.{name}")
+                # 하위 모듈은 한 번만 만들고 모듈 속성으로 저장 (이후 접근은 __getattr__ 미호출)
+                child = DummyMeCab(f"{self.__name__}.{name}")
+                setattr(self, name, child)
+                return child
 
         # mecab 모듈 패치
         dummy_mecab = DummyMeCab('mecab')
@@ -253,7 +381,9 @@ class OpenVoiceEngine(BaseTTSEngine):
                 return self
 
             def __getattr__(self, name):
-                return DummyModule(f"{self.__name__}.{name}")
+                child = DummyModule(f"{self.__name__}.{name}")
+                setattr(self, name, child)
+                return child
 
         modules_to_patch = [
             'unidic', 'unidic_lite', 'unidic-lite',
@@ -294,13 +424,19 @@ class OpenVoiceEngine(BaseTTSEngine):
 
             # 3. load_state_dict 함수 내부에서 사용되는 참조도 패치
             # modeling_utils.load_state_dict가 클로저로 check_torch_load_is_safe를 참조하므로
-            # load_state_dict 함수 자체를 패치
-            original_load_state_dict = modeling_utils.load_state_dict
-            def patched_load_state_dict(checkpoint_file, map_location="cpu", weights_only=False, **kwargs):
-                import torch
-                # torch.load에 전달 가능한 파라미터만 추출
-                return torch.load(checkpoint_file, map_location=map_location, weights_only=weights_only)
-            modeling_utils.load_state_dict = patched_load_state_dict
+            # load_state_dict 함수 자체를 패치 (이미 패치된 경우 생략)
+            if not getattr(modeling_utils.load_state_dict, '__adflow_patched__', False):
+                def patched_load_state_dict(checkpoint_file, map_location="cpu", weights_only=False, **kwargs):
+                    import torch
+                    # torch.load에 전달 가능한 파라미터만 추출
+                    # mmap으로 읽어 큰 체크포인트를 메모리에 두 번 올리지 않음 (구형 포맷/torch는 폴백)
+                    try:
+                        return torch.load(checkpoint_file, map_location=map_location,
+                                          weights_only=weights_only, mmap=True)
+                    except (TypeError, RuntimeError):
+                        return torch.load(checkpoint_file, map_location=map_location, weights_only=weights_only)
+                patched_load_state_dict.__adflow_patched__ = True
+                modeling_utils.load_state_dict = patched_load_state_dict
 
             print("[OpenVoice] transformers 보안 체크 우회 패치 적용")
         except Exception as e:
@@ -334,11 +470,15 @@ class OpenVoiceEngine(BaseTTSEngine):
         except Exception as e:
             print(f"[OpenVoice] se_extractor 패치 실패 (무시): {e}")
 
-        self._mecab_patched = True
+        OpenVoiceEngine._mecab_patched = True
         print("[OpenVoice] mecab 모듈 의존성 우회 패치 적용")
 
     def initialize(self) -> bool:
-        """모델 로드"""
+        """모델 로드 (선로드 스레드와 동시에 호출되어도 한 번만 로드)"""
+        with self._init_lock:
+            return self._initialize()
+
+    def _initialize(self) -> bool:
         if self._is_initialized:
             return True
 
@@ -361,10 +501,27 @@ class OpenVoiceEngine(BaseTTSEngine):
             self._device = "cuda" if torch.cuda.is_available() else "cpu"
             print(f"[OpenVoice] 디바이스: {self._device}")
 
-            # MeloTTS 모델 로드 (한국어만 사용)
-            print("[OpenVoice] MeloTTS 모델 로드 중...")
-            self._tts_model = MeloTTS(language='KR', device=self._device)
-            print("[OpenVoice] MeloTTS 모델 로드 완료")
+            # MeloTTS 모델 로드 (한국어만 사용, 이전에 로드한 모델이 있으면 재사용)
+            model_key = ('KR', self._device)
+            with _POOL_LOCK:
+                self._tts_model = _MODEL_POOL.get(model_key)
+            if self._tts_model is None:
+                print("[OpenVoice] MeloTTS 모델 로드 중...")
+                self._tts_model = MeloTTS(language='KR', device=self._device)
+                # 추론 전용 모드 (dropout 등 비활성화)
+                if hasattr(self._tts_model, 'model'):
+                    self._tts_model.model.eval()
+                    if _FP16_ENABLED and self._device == "cuda":
+                        self._tts_model.model.half()
+                with _POOL_LOCK:
+                    _MODEL_POOL[model_key] = self._tts_model
+                print("[OpenVoice] MeloTTS 모델 로드 완료")
+
+            # MeloTTS 화자 ID (한국어 기본 - 첫 번째 화자)
+            self._default_speaker_id = next(iter(self._tts_model.hps.data.spk2id.values()))
+
+            # 이전 세션에서 추출한 소스 음색 로드
+            self._load_source_se()
 
             # OpenVoice ToneColorConverter는 클로닝 시에만 로드
             self._is_initialized = True
@@ -379,8 +536,75 @@ class OpenVoiceEngine(BaseTTSEngine):
                 self.on_error("initialize", self._last_error)
             return False
 
+    def _load_source_se(self):
+        """저장된 소스 음색 임베딩 로드 (없거나 손상되면 다음 생성 시 재추출)"""
+        if self._source_se is not None:
+            return
+        path = _find_se_file(self._source_se_base)
+        if path is None:
+            return
+        try:
+            self._source_se = self._load_se(path)
+            print("[OpenVoice] 저장된 소스 음색 로드 완료")
+        except Exception as e:
+            print(f"[OpenVoice] 소스 음색 로드 실패 (재추출): {e}")
+            self._source_se = None
+
+    def _inference_context(self):
+        """음성 생성용 컨텍스트 (inference_mode, ADFLOW_FP16=1이면 autocast 추가)"""
+        import torch
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if _FP16_ENABLED:
+            if self._device == "cuda":
+                stack.enter_context(torch.autocast(device_type="cuda", dtype=torch.float16))
+            else:
+                stack.enter_context(torch.autocast(device_type="cpu", dtype=torch.bfloat16))
+        return stack
+
+    # === 음색 임베딩 저장/로드 ===
+
+    def _load_se(self, path: str):
+        """음색 임베딩 로드 (safetensors는 복사 없이 매핑, .pth는 torch.load)"""
+        if path.endswith(".safetensors"):
+            from safetensors.torch import load_file
+            return load_file(path, device=str(self._device))["se"]
+        import torch
+        return torch.load(path, map_location=self._device)
+
+    @staticmethod
+    def _save_se(se, base: str) -> str:
+        """음색 임베딩 저장 - safetensors 우선, 없으면 .pth (저장 경로 반환)
+
+        반정밀도 추론 중 추출된 임베딩도 FP32로 저장해 설정과 무관하게 읽을 수 있게 함
+        """
+        se = se.detach().float()
+        try:
+            from safetensors.torch import save_file
+        except ImportError:
+            import torch
+            path = base + ".pth"
+            torch.save(se, path)
+            return path
+        path = base + ".safetensors"
+        save_file({"se": se.contiguous().cpu()}, path)
+        return path
+
+    def start_preload(self):
+        """백그라운드 스레드에서 모델 로드 시작 (첫 생성 시 대기 시간 단축)"""
+        if self._is_initialized or self._init_thread is not None:
+            return
+        self._init_thread = threading.Thread(
+            target=self.initialize, name="openvoice-preload", daemon=True
+        )
+        self._init_thread.start()
+
     def _ensure_initialized(self) -> bool:
-        """초기화 확인 및 자동 초기화"""
+        """초기화 확인 및 자동 초기화 (선로드 중이면 완료까지 대기)"""
+        thread = self._init_thread
+        if thread is not None:
+            thread.join()
+            self._init_thread = None
         if not self._is_initialized:
             return self.initialize()
         return True
@@ -390,31 +614,36 @@ class OpenVoiceEngine(BaseTTSEngine):
         if self._tone_converter is not None:
             return True
 
+        converter_key = (self._models_path, self._device)
+        with _POOL_LOCK:
+            self._tone_converter = _CONVERTER_POOL.get(converter_key)
+        if self._tone_converter is not None:
+            return True
+
         try:
             import torch
             from openvoice.api import ToneColorConverter
 
             # 체크포인트 경로
             ckpt_converter = os.path.join(self._models_path, "converter")
+            config_path = os.path.join(ckpt_converter, "checkpoints_v2", "converter", "config.json")
+            ckpt_path = os.path.join(ckpt_converter, "checkpoints_v2", "converter", "checkpoint.pth")
 
-            # 체크포인트가 없으면 다운로드
-            if not os.path.exists(ckpt_converter):
+            # 체크포인트가 없으면 다운로드 (중단된 다운로드도 이어받음)
+            if not (os.path.exists(config_path) and os.path.exists(ckpt_path)):
                 print("[OpenVoice] ToneColorConverter 모델 다운로드 중...")
                 os.makedirs(ckpt_converter, exist_ok=True)
-                # HuggingFace에서 다운로드
-                from huggingface_hub import snapshot_download
-                snapshot_download(
-                    repo_id="myshell-ai/OpenVoice",
-                    local_dir=ckpt_converter,
-                    allow_patterns=["checkpoints_v2/*"]
-                )
-
-            config_path = os.path.join(ckpt_converter, "checkpoints_v2", "converter", "config.json")
-            ckpt_path = os.path.join(ckpt_converter, "checkpoints_v2", "converter", "checkpoint.pth")
+                self._download_converter(ckpt_converter)
 
             if os.path.exists(config_path) and os.path.exists(ckpt_path):
                 self._tone_converter = ToneColorConverter(config_path, device=self._device)
                 self._tone_converter.load_ckpt(ckpt_path)
+                if hasattr(self._tone_converter, 'model'):
+                    self._tone_converter.model.eval()
+                    if _FP16_ENABLED and self._device == "cuda":
+                        self._tone_converter.model.half()
+                with _POOL_LOCK:
+                    _CONVERTER_POOL[converter_key] = self._tone_converter
                 print("[OpenVoice] ToneColorConverter 로드 완료")
                 return True
             else:
@@ -427,6 +656,25 @@ class OpenVoiceEngine(BaseTTSEngine):
             print(f"[OpenVoice] {self._last_error}")
             return False
 
+    @staticmethod
+    def _download_converter(local_dir: str):
+        """HuggingFace에서 변환기 체크포인트 다운로드 (병렬, 일시적 오류 시 재시도)"""
+        from huggingface_hub import snapshot_download
+        for attempt in range(_DOWNLOAD_ATTEMPTS):
+            try:
+                snapshot_download(
+                    repo_id="myshell-ai/OpenVoice",
+                    local_dir=local_dir,
+                    allow_patterns=["checkpoints_v2/*"],
+                    max_workers=8
+                )
+                return
+            except Exception as e:
+                if attempt == _DOWNLOAD_ATTEMPTS - 1:
+                    raise
+                print(f"[OpenVoice] 다운로드 실패, 재시도 ({attempt + 1}/{_DOWNLOAD_ATTEMPTS}): {e}")
+                time.sleep(2 ** attempt)
+
     def generate(self, request: TTSRequest) -> TTSResult:
         """TTS 생성"""
         # 초기화 확인
@@ -436,6 +684,36 @@ class OpenVoiceEngine(BaseTTSEngine):
                 error_message="OpenVoice 엔진 초기화 실패"
             )
 
+        return self._generate_one(request)
+
+    def generate_many(self, requests: List[TTSRequest],
+                      on_result: Optional[Callable[[int, TTSResult], None]] = None) -> List[TTSResult]:
+        """여러 요청 일괄 생성
+
+        초기화 확인과 ToneColorConverter 로드를 한 번만 하고, 같은 클로닝 음성의
+        음색 임베딩은 한 번만 읽는다. 전체 루프를 inference_mode로 감싼다.
+        """
+        if not self._ensure_initialized():
+            results = []
+            for i in range(len(requests)):
+                result = TTSResult(success=False, error_message="OpenVoice 엔진 초기화 실패")
+                if on_result:
+                    on_result(i, result)
+                results.append(result)
+            return results
+
+        target_ses: Dict[str, object] = {}
+        results = []
+        with self._inference_context():
+            for i, request in enumerate(requests):
+                result = self._generate_one(request, target_ses)
+                if on_result:
+                    on_result(i, result)
+                results.append(result)
+        return results
+
+    def _generate_one(self, request: TTSRequest, target_ses: Optional[Dict[str, object]] = None) -> TTSResult:
+        """초기화된 상태에서 단일 요청 생성"""
         try:
             # 출력 디렉토리 생성
             os.makedirs(os.path.dirname(request.output_path), exist_ok=True)
@@ -443,12 +721,14 @@ class OpenVoiceEngine(BaseTTSEngine):
             # 클로닝된 음성인지 확인
             is_cloned = request.voice_id in self._cloned_voices
 
-            if is_cloned:
-                # 클로닝된 음성: MeloTTS 생성 후 음색 변환
-                return self._generate_cloned(request)
-            else:
-                # 기본 음성: MeloTTS로 직접 생성
-                return self._generate_base(request)
+            # 추론 전용 - autograd 기록 없이 실행
+            with self._inference_context():
+                if is_cloned:
+                    # 클로닝된 음성: MeloTTS 생성 후 음색 변환
+                    return self._generate_cloned(request, target_ses)
+                else:
+                    # 기본 음성: MeloTTS로 직접 생성
+                    return self._generate_base(request)
 
         except Exception as e:
             return TTSResult(
@@ -459,21 +739,8 @@ class OpenVoiceEngine(BaseTTSEngine):
     def _generate_base(self, request: TTSRequest) -> TTSResult:
         """기본 MeloTTS 음성 생성"""
         try:
-            # MeloTTS 화자 ID (한국어 기본)
-            speaker_ids = self._tts_model.hps.data.spk2id
-            speaker_id = list(speaker_ids.values())[0]  # 첫 번째 화자
-
-            # 속도 조절 (-5 ~ +5 → 0.5 ~ 2.0)
-            speed = 1.0 - (request.speed * 0.1)  # speed=0이면 1.0, speed=5이면 0.5
-            speed = max(0.5, min(2.0, speed))
-
             # TTS 생성
-            self._tts_model.tts_to_file(
-                request.text,
-                speaker_id,
-                request.output_path,
-                speed=speed
-            )
+            self._synthesize(request.text, self._melo_speed(request.speed), request.output_path)
 
             if os.path.exists(request.output_path):
                 return TTSResult(
@@ -492,8 +759,12 @@ class OpenVoiceEngine(BaseTTSEngine):
                 error_message=f"MeloTTS 생성 실패: {str(e)}"
             )
 
-    def _generate_cloned(self, request: TTSRequest) -> TTSResult:
-        """클로닝된 음성으로 생성"""
+    def _generate_cloned(self, request: TTSRequest,
+                         target_ses: Optional[Dict[str, object]] = None) -> TTSResult:
+        """클로닝된 음성으로 생성
+
+        target_ses가 주어지면 음성별로 읽은 음색 임베딩을 재사용한다 (일괄 생성용).
+        """
         try:
             print(f"[OpenVoice] 클로닝 음성 생성 시작: {request.voice_id}")
 
@@ -513,66 +784,35 @@ class OpenVoiceEngine(BaseTTSEngine):
                 )
 
             # 음색 임베딩 로드
-            se_path = os.path.join(self._cloned_voices_dir, f"{request.voice_id}.pth")
-            if not os.path.exists(se_path):
+            target_se = self._get_target_se(request.voice_id, target_ses)
+            if target_se is None:
                 return TTSResult(
                     success=False,
-                    error_message=f"음색 데이터 없음: {se_path}"
+                    error_message=f"음색 데이터 없음: {request.voice_id}"
                 )
 
-            import torch
-            print(f"[OpenVoice] 음색 임베딩 로드: {se_path}")
-            target_se = torch.load(se_path, map_location=self._device)
-
             # 임시 파일로 기본 음성 생성
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-                tmp_path = tmp.name
+            tmp_path = self._new_scratch_wav()
 
             try:
                 # MeloTTS로 기본 음성 생성
-                speaker_ids = self._tts_model.hps.data.spk2id
-                speaker_id = list(speaker_ids.values())[0]
-
-                speed = 1.0 - (request.speed * 0.1)
-                speed = max(0.5, min(2.0, speed))
-
                 print(f"[OpenVoice] MeloTTS 음성 생성 중... (텍스트 길이: {len(request.text)}자)")
-                self._tts_model.tts_to_file(
-                    request.text,
-                    speaker_id,
-                    tmp_path,
-                    speed=speed
-                )
+                self._synthesize(request.text, self._melo_speed(request.speed), tmp_path)
                 print(f"[OpenVoice] MeloTTS 음성 생성 완료: {tmp_path}")
 
-                # 임시 파일 확인
-                if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) == 0:
+                # 임시 파일 확인 (stat 한 번으로 존재 여부와 크기 확인)
+                try:
+                    tmp_size = os.stat(tmp_path).st_size
+                except FileNotFoundError:
+                    tmp_size = 0
+                if tmp_size == 0:
                     return TTSResult(
                         success=False,
                         error_message="MeloTTS 음성 파일 생성 실패 (파일 없음 또는 0바이트)"
                     )
 
-                # 소스 음색 추출 (MeloTTS 기본 음성)
-                if self._source_se is None:
-                    print("[OpenVoice] 소스 음색 추출 중...")
-                    from openvoice import se_extractor
-                    self._source_se, _ = se_extractor.get_se(
-                        tmp_path,
-                        self._tone_converter,
-                        vad=False
-                    )
-                    print("[OpenVoice] 소스 음색 추출 완료")
-
                 # 음색 변환
-                print("[OpenVoice] 음색 변환 중...")
-                self._tone_converter.convert(
-                    audio_src_path=tmp_path,
-                    src_se=self._source_se,
-                    tgt_se=target_se,
-                    output_path=request.output_path,
-                    message="@MyShell"
-                )
-                print(f"[OpenVoice] 음색 변환 완료: {request.output_path}")
+                self._convert_tone(tmp_path, target_se, request.output_path)
 
                 if os.path.exists(request.output_path):
                     return TTSResult(
@@ -587,8 +827,10 @@ class OpenVoiceEngine(BaseTTSEngine):
 
             finally:
                 # 임시 파일 삭제
-                if os.path.exists(tmp_path):
+                try:
                     os.remove(tmp_path)
+                except FileNotFoundError:
+                    pass
 
         except Exception as e:
             import traceback
@@ -599,6 +841,185 @@ class OpenVoiceEngine(BaseTTSEngine):
                 error_message=f"클로닝 음성 생성 실패: {str(e)}"
             )
 
+    def generate_streaming(self, request: TTSRequest,
+                           on_chunk: Optional[Callable[[int, str], None]] = None) -> TTSResult:
+        """문장 단위 파이프라인 생성
+
+        클로닝 음성은 문장 N을 별도 스레드에서 음색 변환하는 동안 문장 N+1을
+        MeloTTS로 합성한다. 완성된 문장 조각은 순서대로 on_chunk(인덱스, 경로)로
+        알리고, 마지막에 request.output_path 하나로 합친다.
+        조각 파일은 합친 뒤 삭제되므로 콜백 안에서만 사용할 수 있다.
+        """
+        if not self._ensure_initialized():
+            return TTSResult(
+                success=False,
+                error_message="OpenVoice 엔진 초기화 실패"
+            )
+
+        pieces = self._split_sentences(request.text)
+        if len(pieces) <= 1:
+            result = self._generate_one(request)
+            if result.success and on_chunk:
+                on_chunk(0, result.output_path)
+            return result
+
+        base, _ = os.path.splitext(request.output_path)
+        part_paths = [f"{base}.part{i}.wav" for i in range(len(pieces))]
+        try:
+            os.makedirs(os.path.dirname(request.output_path), exist_ok=True)
+
+            target_se = None
+            if request.voice_id in self._cloned_voices:
+                if not self._load_tone_converter():
+                    return TTSResult(
+                        success=False,
+                        error_message="ToneColorConverter 로드 실패"
+                    )
+                target_se = self._get_target_se(request.voice_id)
+                if target_se is None:
+                    return TTSResult(
+                        success=False,
+                        error_message=f"음색 데이터 없음: {request.voice_id}"
+                    )
+
+            speed = self._melo_speed(request.speed)
+            with self._inference_context(), ThreadPoolExecutor(max_workers=1) as converter:
+                pending = None
+                for i, piece in enumerate(pieces):
+                    if target_se is None:
+                        # 기본 음성: 변환 단계 없음
+                        self._synthesize(piece, speed, part_paths[i])
+                        if on_chunk:
+                            on_chunk(i, part_paths[i])
+                        continue
+
+                    tmp_path = self._new_scratch_wav()
+                    try:
+                        self._synthesize(piece, speed, tmp_path)
+                        future = converter.submit(self._convert_part, tmp_path, target_se, part_paths[i])
+                    except BaseException:
+                        # 제출 전 실패: _convert_part가 지우지 못하므로 여기서 삭제
+                        try:
+                            os.remove(tmp_path)
+                        except FileNotFoundError:
+                            pass
+                        raise
+                    # 이전 문장 변환은 이번 문장 합성과 겹쳐서 진행됨
+                    if pending is not None:
+                        pending[1].result()
+                        if on_chunk:
+                            on_chunk(pending[0], part_paths[pending[0]])
+                    pending = (i, future)
+
+                if pending is not None:
+                    pending[1].result()
+                    if on_chunk:
+                        on_chunk(pending[0], part_paths[pending[0]])
+
+            _concat_wavs(part_paths, request.output_path)
+            return TTSResult(
+                success=True,
+                output_path=request.output_path
+            )
+
+        except Exception as e:
+            return TTSResult(
+                success=False,
+                error_message=f"TTS 생성 실패: {str(e)}"
+            )
+
+        finally:
+            for path in part_paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def _split_sentences(self, text: str) -> List[str]:
+        """MeloTTS 문장 분할기로 텍스트 분할 (사용할 수 없으면 통째로)"""
+        try:
+            pieces = self._tts_model.split_sentences_into_pieces(
+                text, self._tts_model.language, quiet=True
+            )
+        except Exception:
+            return [text]
+        return [p for p in pieces if p.strip()] or [text]
+
+    @staticmethod
+    def _melo_speed(speed: int) -> float:
+        """속도 조절 (-5 ~ +5 → 0.5 ~ 2.0, speed=0이면 1.0, speed=5이면 0.5)"""
+        return max(0.5, min(2.0, 1.0 - (speed * 0.1)))
+
+    @staticmethod
+    def _new_scratch_wav() -> str:
+        """중간 WAV용 임시 파일 경로"""
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False, dir=_SCRATCH_DIR) as tmp:
+            return tmp.name
+
+    def _synthesize(self, text: str, speed: float, output_path: str):
+        """MeloTTS 기본 화자로 합성"""
+        self._tts_model.tts_to_file(
+            text,
+            self._default_speaker_id,
+            output_path,
+            speed=speed
+        )
+
+    def _get_target_se(self, voice_id: str, target_ses: Optional[Dict[str, object]] = None):
+        """클로닝 음성의 음색 임베딩 (파일이 없으면 None)
+
+        target_ses가 주어지면 음성별로 읽은 음색 임베딩을 재사용한다 (일괄 생성용).
+        """
+        target_se = target_ses.get(voice_id) if target_ses is not None else None
+        if target_se is not None:
+            return target_se
+
+        se_path = _find_se_file(os.path.join(self._cloned_voices_dir, voice_id))
+        if se_path is None:
+            return None
+
+        print(f"[OpenVoice] 음색 임베딩 로드: {se_path}")
+        target_se = self._load_se(se_path)
+        if target_ses is not None:
+            target_ses[voice_id] = target_se
+        return target_se
+
+    def _convert_tone(self, src_path: str, target_se, output_path: str):
+        """MeloTTS 음성을 대상 음색으로 변환 (필요 시 소스 음색 추출)"""
+        # 소스 음색 추출 (MeloTTS 기본 음성)
+        # TTS 출력은 무음 구간이 없는 깨끗한 단일 구간이므로 se_extractor의
+        # 분할/해시/복사 단계 없이 파일 전체를 한 구간으로 바로 추출
+        if self._source_se is None:
+            print("[OpenVoice] 소스 음색 추출 중...")
+            self._source_se = self._tone_converter.extract_se([src_path])
+            print("[OpenVoice] 소스 음색 추출 완료")
+            try:
+                self._save_se(self._source_se, self._source_se_base)
+            except Exception as e:
+                print(f"[OpenVoice] 소스 음색 저장 실패 (무시): {e}")
+
+        print("[OpenVoice] 음색 변환 중...")
+        self._tone_converter.convert(
+            audio_src_path=src_path,
+            src_se=self._source_se,
+            tgt_se=target_se,
+            output_path=output_path,
+            message="@MyShell"
+        )
+        print(f"[OpenVoice] 음색 변환 완료: {output_path}")
+
+    def _convert_part(self, src_path: str, target_se, output_path: str):
+        """파이프라인 변환 단계 (작업 스레드에서 실행, 중간 파일 삭제)"""
+        try:
+            # inference_mode/autocast는 스레드별이므로 작업 스레드에서 다시 진입
+            with self._inference_context():
+                self._convert_tone(src_path, target_se, output_path)
+        finally:
+            try:
+                os.remove(src_path)
+            except FileNotFoundError:
+                pass
+
     # === 음성 클로닝 ===
 
     def clone_voice(self, reference_audio: str, voice_name: str) -> Optional[VoiceInfo]:
@@ -627,35 +1048,58 @@ class OpenVoiceEngine(BaseTTSEngine):
             return None
 
         try:
-            # ToneColorConverter 로드
-            if not self._load_tone_converter():
-                self._last_error = self._last_error or "ToneColorConverter 로드 실패"
-                return None
+            # 참조 오디오 해시 (음성 ID와 음색 캐시 키로 사용)
+            ref_sha = self._reference_sha256(reference_audio)
+
+            # 내용 기반 ID - 같은 오디오를 다시 클로닝하면 기존 음성을 재사용
+            voice_id = f"clone_{ref_sha[:12]}"
+            se_base = os.path.join(self._cloned_voices_dir, voice_id)
+            existing = self._cloned_voices.get(voice_id)
+            if existing is not None and _find_se_file(se_base) is not None:
+                print(f"[OpenVoice] 이미 클로닝된 음성 재사용: {voice_id}")
+                if existing.name != voice_name:
+                    existing = dataclasses.replace(existing, name=voice_name)
+                    self._cloned_voices[voice_id] = existing
+                    self._save_cloned_voices()
+                return existing
+
+            cached_se_base = os.path.join(self._se_cache_dir, ref_sha)
+            cached_se_path = _find_se_file(cached_se_base)
+
+            if cached_se_path is not None:
+                print(f"[OpenVoice] 저장된 음색 재사용: {reference_audio}")
+                ext = os.path.splitext(cached_se_path)[1]
+                _fast_copy(cached_se_path, se_base + ext)
+            else:
+                # ToneColorConverter 로드
+                if not self._load_tone_converter():
+                    self._last_error = self._last_error or "ToneColorConverter 로드 실패"
+                    return None
+
+                # 음색 특성 추출
+                print(f"[OpenVoice] 음색 추출 중: {reference_audio}")
+                from openvoice import se_extractor
+
+                # ADFLOW_FP16=1이면 변환기 가중치가 FP16이므로 생성과 같은 autocast 안에서 추출
+                with self._inference_context():
+                    target_se, _ = se_extractor.get_se(
+                        reference_audio,
+                        self._tone_converter,
+                        vad=True  # Voice Activity Detection
+                    )
 
-            # 고유 ID 생성
-            import uuid
-            voice_id = f"clone_{uuid.uuid4().hex[:8]}"
+                # 음색 임베딩 저장
+                se_path = self._save_se(target_se, se_base)
+                print(f"[OpenVoice] 음색 저장: {se_path}")
+                try:
+                    _fast_copy(se_path, cached_se_base + os.path.splitext(se_path)[1])
+                except OSError:
+                    pass
 
             # 참조 오디오 복사
             ref_filename = f"{voice_id}{os.path.splitext(reference_audio)[1]}"
             ref_dest = os.path.join(self._cloned_voices_dir, ref_filename)
-            shutil.copy2(reference_audio, ref_dest)
-
-            # 음색 특성 추출
-            print(f"[OpenVoice] 음색 추출 중: {reference_audio}")
-            from openvoice import se_extractor
-            import torch
-
-            target_se, _ = se_extractor.get_se(
-                reference_audio,
-                self._tone_converter,
-                vad=True  # Voice Activity Detection
-            )
-
-            # 음색 임베딩 저장
-            se_path = os.path.join(self._cloned_voices_dir, f"{voice_id}.pth")
-            torch.save(target_se, se_path)
-            print(f"[OpenVoice] 음색 저장: {se_path}")
+            _fast_copy(reference_audio, ref_dest)
 
             # 음성 정보 생성
             voice_info = VoiceInfo(
@@ -667,7 +1111,8 @@ class OpenVoiceEngine(BaseTTSEngine):
                 description=f"'{os.path.basename(reference_audio)}'에서 클로닝",
                 metadata={
                     "is_cloned": True,
-                    "reference_file": ref_filename
+                    "reference_file": ref_filename,
+                    "ref_sha": ref_sha
                 }
             )
 
@@ -683,6 +1128,26 @@ class OpenVoiceEngine(BaseTTSEngine):
                 self.on_error("clone_voice", self._last_error)
             return None
 
+    def _reference_sha256(self, path: str) -> str:
+        """참조 오디오 SHA-256 (경로/크기/수정 시각이 같으면 이전 결과 재사용)"""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        sha = self._ref_sha_cache.get(key)
+        if sha is None:
+            sha = self._ref_sha_cache[key] = self._file_sha256(path)
+        return sha
+
+    @staticmethod
+    def _file_sha256(path: str) -> str:
+        """파일 SHA-256 (file_digest가 있으면 파이썬 루프 없이 버퍼 재사용)"""
+        with open(path, 'rb') as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+
     def delete_cloned_voice(self, voice_id: str) -> bool:
         """클로닝된 음성 삭제"""
         if voice_id not in self._cloned_voices:
@@ -691,17 +1156,17 @@ class OpenVoiceEngine(BaseTTSEngine):
         try:
             voice_info = self._cloned_voices[voice_id]
 
-            # 참조 파일 삭제
+            # 참조 파일과 음색 데이터 삭제 (없는 파일은 건너뜀)
+            se_base = os.path.join(self._cloned_voices_dir, voice_id)
+            paths = [se_base + ext for ext in _SE_EXTENSIONS]
             ref_file = voice_info.metadata.get("reference_file", "")
             if ref_file:
-                ref_path = os.path.join(self._cloned_voices_dir, ref_file)
-                if os.path.exists(ref_path):
-                    os.remove(ref_path)
-
-            # 음색 데이터 삭제
-            se_path = os.path.join(self._cloned_voices_dir, f"{voice_id}.pth")
-            if os.path.exists(se_path):
-                os.remove(se_path)
+                paths.append(os.path.join(self._cloned_voices_dir, ref_file))
+            for path in paths:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
 
             del self._cloned_voices[voice_id]
             self._save_cloned_voices()
@@ -717,8 +1182,9 @@ class OpenVoiceEngine(BaseTTSEngine):
         """클로닝된 음성 목록"""
         return list(self._cloned_voices.values())
 
-    def _load_cloned_voices(self):
+    def _load_cloned_voices(self) -> Dict[str, VoiceInfo]:
         """저장된 클로닝 음성 로드"""
+        voices: Dict[str, VoiceInfo] = {}
         voices_file = os.path.join(self._cloned_voices_dir, "voices.json")
         if os.path.exists(voices_file):
             try:
@@ -735,9 +1201,10 @@ class OpenVoiceEngine(BaseTTSEngine):
                             description=voice_data.get('description', ''),
                             metadata=voice_data.get('metadata', {})
                         )
-                        self._cloned_voices[voice.id] = voice
+                        voices[voice.id] = voice
             except Exception:
                 pass
+        return voices
 
     def _save_cloned_voices(self):
         """클로닝 음성 저장"""
@@ -758,13 +1225,16 @@ class OpenVoiceEngine(BaseTTSEngine):
                     for v in self._cloned_voices.values()
                 ]
             }
-            with open(voices_file, 'w', encoding='utf-8') as f:
+            # 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 목록 유지)
+            tmp_path = f"{voices_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, voices_file)
         except Exception:
             pass
 
     def shutdown(self):
-        """엔진 종료"""
+        """엔진 종료 (로드된 모델은 공유 풀에 남아 재초기화 시 재사용)"""
         self._tone_converter = None
         self._tts_model = None
         self._source_se = None
@@ -3,8 +3,12 @@
 
 import os
 import json
+from functools import cached_property
+from itertools import chain
+from operator import attrgetter
+from collections import defaultdict
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Iterable, Tuple
 from datetime import datetime
 
 
@@ -37,14 +41,36 @@ class VoiceProfile:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
-        """딕셔너리로 변환"""
-        return asdict(self)
+        """딕셔너리로 변환 (asdict의 재귀 깊은 복사 없이 필드 순서대로 구성)"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'engine_id': self.engine_id,
+            'gender': self.gender,
+            'language': self.language,
+            'style': self.style,
+            'supports_emotion': self.supports_emotion,
+            'supports_speed': self.supports_speed,
+            'supports_pitch': self.supports_pitch,
+            'supports_volume': self.supports_volume,
+            'is_cloned': self.is_cloned,
+            'reference_audio': self.reference_audio,
+            'created_at': self.created_at,
+            'tags': list(self.tags),
+            'metadata': dict(self.metadata),
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'VoiceProfile':
         """딕셔너리에서 생성"""
         return cls(**data)
 
+    @cached_property
+    def engine_prefix_and_id(self) -> Tuple[str, str]:
+        """ID를 (접두부, 엔진 내부 음성 ID)로 분리 (예: "clova.vdain" -> ("clova", "vdain"))"""
+        head, _, tail = self.id.rpartition('.')
+        return head or self.engine_id, tail or self.id
+
     @property
     def display_name(self) -> str:
         """UI 표시용 이름"""
@@ -65,6 +91,10 @@ class VoiceProfile:
         return " / ".join(parts)
 
 
+# 프로파일 정렬 기준 (기본 음성 먼저, 이름순)
+_PROFILE_SORT_KEY = attrgetter('is_cloned', 'name')
+
+
 @dataclass
 class TTSSettings:
     """TTS 설정 (현재 선택된 음성 + 옵션)"""
@@ -101,6 +131,13 @@ class VoiceProfileManager:
         self._profiles: Dict[str, VoiceProfile] = {}
         self._custom_profiles: Dict[str, VoiceProfile] = {}
 
+        # 엔진 ID -> 프로파일 ID 집합 (기본 + 커스텀)
+        self._profiles_by_engine: Dict[str, Set[str]] = defaultdict(set)
+
+        # get_all_profiles 결과와 태그 -> 프로파일 색인 (프로파일 추가/삭제 시 무효화)
+        self._all_profiles: Optional[Tuple[VoiceProfile, ...]] = None
+        self._profiles_by_tag: Optional[Dict[str, Tuple[VoiceProfile, ...]]] = None
+
         self._ensure_dirs()
         self._load_custom_profiles()
 
@@ -118,6 +155,7 @@ class VoiceProfileManager:
                     for profile_data in data.get('custom_voices', []):
                         profile = VoiceProfile.from_dict(profile_data)
                         self._custom_profiles[profile.id] = profile
+                        self._profiles_by_engine[profile.engine_id].add(profile.id)
             except Exception as e:
                 print(f"커스텀 프로파일 로드 실패: {e}")
 
@@ -127,21 +165,56 @@ class VoiceProfileManager:
             data = {
                 'custom_voices': [p.to_dict() for p in self._custom_profiles.values()]
             }
-            with open(self.profiles_file, 'w', encoding='utf-8') as f:
+            # 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 파일 유지)
+            tmp_path = f"{self.profiles_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.profiles_file)
         except Exception as e:
             print(f"커스텀 프로파일 저장 실패: {e}")
 
+    def _invalidate_lists(self):
+        """정렬된 목록/태그 색인 무효화 (다음 조회 시 재생성)"""
+        self._all_profiles = None
+        self._profiles_by_tag = None
+
     def register_profile(self, profile: VoiceProfile):
         """프로파일 등록 (엔진에서 호출)"""
+        old = self._profiles.get(profile.id)
+        if old is not None and old.engine_id != profile.engine_id:
+            self._profiles_by_engine[old.engine_id].discard(profile.id)
         self._profiles[profile.id] = profile
+        self._invalidate_lists()
+        self._profiles_by_engine[profile.engine_id].add(profile.id)
+
+    def register_profiles(self, profiles: Iterable[VoiceProfile]):
+        """프로파일 일괄 등록"""
+        for profile in profiles:
+            self.register_profile(profile)
+
+    def replace_engine_profiles(self, engine_id: str, profiles: Iterable[VoiceProfile]):
+        """엔진의 기본 프로파일을 새 목록으로 교체 (없어진 음성만 제거)"""
+        profiles = list(profiles)
+        new_ids = {p.id for p in profiles}
+        for pid in [pid for pid in self._profiles_by_engine.get(engine_id, ())
+                    if pid in self._profiles and pid not in new_ids]:
+            del self._profiles[pid]
+            self._invalidate_lists()
+            if pid not in self._custom_profiles:
+                self._profiles_by_engine[engine_id].discard(pid)
+        self.register_profiles(profiles)
 
     def register_custom_profile(self, profile: VoiceProfile) -> bool:
         """커스텀 프로파일 등록"""
         profile.is_cloned = True
         if not profile.created_at:
             profile.created_at = datetime.now().isoformat()
+        old = self._custom_profiles.get(profile.id)
+        if old is not None and old.engine_id != profile.engine_id:
+            self._profiles_by_engine[old.engine_id].discard(profile.id)
         self._custom_profiles[profile.id] = profile
+        self._invalidate_lists()
+        self._profiles_by_engine[profile.engine_id].add(profile.id)
         self._save_custom_profiles()
         return True
 
@@ -152,12 +225,14 @@ class VoiceProfileManager:
             # 참조 오디오 삭제
             if profile.reference_audio:
                 ref_path = os.path.join(self.references_dir, profile.reference_audio)
-                if os.path.exists(ref_path):
-                    try:
-                        os.remove(ref_path)
-                    except:
-                        pass
+                try:
+                    os.unlink(ref_path)
+                except OSError:
+                    pass
             del self._custom_profiles[profile_id]
+            self._invalidate_lists()
+            if profile_id not in self._profiles:
+                self._profiles_by_engine[profile.engine_id].discard(profile_id)
             self._save_custom_profiles()
             return True
         return False
@@ -166,14 +241,29 @@ class VoiceProfileManager:
         """프로파일 조회"""
         return self._profiles.get(profile_id) or self._custom_profiles.get(profile_id)
 
-    def get_all_profiles(self) -> List[VoiceProfile]:
-        """전체 프로파일 목록 (기본 + 커스텀)"""
-        all_profiles = list(self._profiles.values()) + list(self._custom_profiles.values())
-        return sorted(all_profiles, key=lambda p: (p.is_cloned, p.name))
+    def get_all_profiles(self) -> Tuple[VoiceProfile, ...]:
+        """전체 프로파일 목록 (기본 + 커스텀, 변경될 때만 다시 정렬)"""
+        if self._all_profiles is None:
+            self._all_profiles = tuple(sorted(
+                chain(self._profiles.values(), self._custom_profiles.values()),
+                key=_PROFILE_SORT_KEY
+            ))
+        return self._all_profiles
 
     def get_profiles_by_engine(self, engine_id: str) -> List[VoiceProfile]:
         """엔진별 프로파일 목록"""
-        return [p for p in self.get_all_profiles() if p.engine_id == engine_id]
+        profiles = [self.get_profile(pid) for pid in self._profiles_by_engine.get(engine_id, ())]
+        return sorted(profiles, key=_PROFILE_SORT_KEY)
+
+    def get_profiles_by_tag(self, tag: str) -> Tuple[VoiceProfile, ...]:
+        """태그별 프로파일 목록 (정렬 순서 유지, 변경될 때만 색인 재생성)"""
+        if self._profiles_by_tag is None:
+            by_tag: Dict[str, List[VoiceProfile]] = defaultdict(list)
+            for profile in self.get_all_profiles():
+                for t in set(profile.tags):
+                    by_tag[t].append(profile)
+            self._profiles_by_tag = {t: tuple(ps) for t, ps in by_tag.items()}
+        return self._profiles_by_tag.get(tag, ())
 
     def get_custom_profiles(self) -> List[VoiceProfile]:
         """커스텀 프로파일만"""
@@ -181,10 +271,14 @@ class VoiceProfileManager:
 
     def clear_engine_profiles(self, engine_id: str):
         """특정 엔진의 기본 프로파일 제거"""
-        self._profiles = {
-            k: v for k, v in self._profiles.items()
-            if v.engine_id != engine_id
-        }
+        ids = self._profiles_by_engine.get(engine_id)
+        if not ids:
+            return
+        for pid in [pid for pid in ids if pid in self._profiles]:
+            del self._profiles[pid]
+            self._invalidate_lists()
+            if pid not in self._custom_profiles:
+                ids.discard(pid)
 
     def get_reference_path(self, filename: str) -> str:
         """참조 오디오 전체 경로"""
@@ -1,16 +1,24 @@
 # core/tts_engine.py
 # CLOVA Voice TTS 엔진
 
-import ssl
 import os
 import time
-import urllib.request
+import shutil
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Callable
 from dataclasses import dataclass
 
-# SSL 인증서 우회 (macOS 호환성)
-ssl._create_default_https_context = ssl._create_unverified_context
+from ._https_pool import MAX_RETRIES, RETRY_BACKOFF, RETRY_STATUSES, RequestThrottle, post_form
+
+# 응답 본문을 파일로 옮기는 단위
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# 연결 테스트용 요청 본문 (고정값이므로 한 번만 인코딩)
+_TEST_BODY = urllib.parse.urlencode({
+    "speaker": "nara", "text": "테스트",
+    "volume": 0, "speed": 0, "pitch": 0, "format": "wav",
+}).encode('ascii')
 
 
 @dataclass
@@ -30,6 +38,9 @@ class TTSEngine:
     
     API_URL = "https://naveropenapi.apigw.ntruss.com/tts-premium/v1/tts"
     
+    # 배치 생성 시 동시에 보내는 최대 요청 수
+    BATCH_CONCURRENCY = 4
+    
     def __init__(self, client_id: str = "", client_secret: str = ""):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -44,6 +55,13 @@ class TTSEngine:
         # 상태
         self._cancel_requested = False
         self._is_running = False
+        
+        # 배치 요청 시작 간격 제한 (api_delay 간격 유지)
+        self._throttle = RequestThrottle()
+        
+        # 요청 헤더 (인증 정보가 바뀔 때만 다시 생성)
+        self._headers_key: Optional[tuple] = None
+        self._request_headers: dict = {}
     
     def set_credentials(self, client_id: str, client_secret: str):
         """API 인증 정보 설정"""
@@ -56,68 +74,92 @@ class TTSEngine:
     
     def generate_single(self, text: str, output_path: str) -> bool:
         """단일 텍스트 TTS 생성"""
-        if not self.client_id or not self.client_secret:
+        error = self._request_tts(text, output_path)
+        if error is not None:
             if self.on_error:
-                self.on_error("API 키가 설정되지 않았습니다.", output_path)
+                self.on_error(error, output_path)
             return False
+        return True
+    
+    def _request_tts(self, text: str, output_path: str, make_dirs: bool = True) -> Optional[str]:
+        """TTS API 호출 후 파일 저장 (성공 시 None, 실패 시 오류 메시지)
         
-        # 요청 데이터 구성
-        enc_text = urllib.parse.quote(text)
+        콜백을 호출하지 않으므로 작업 스레드에서 안전하게 사용할 수 있다.
+        make_dirs=False면 출력 폴더가 이미 있다고 보고 생성을 생략한다.
+        """
+        if not self.client_id or not self.client_secret:
+            return "API 키가 설정되지 않았습니다."
         
-        params = [
-            f"speaker={self.options.speaker}",
-            f"text={enc_text}",
-            f"volume={self.options.volume}",
-            f"speed={self.options.speed}",
-            f"pitch={self.options.pitch}",
-            f"format={self.options.format}"
-        ]
+        # 요청 데이터 구성
+        params = {
+            "speaker": self.options.speaker,
+            "text": text,
+            "volume": self.options.volume,
+            "speed": self.options.speed,
+            "pitch": self.options.pitch,
+            "format": self.options.format,
+        }
         
         # 감정 설정 (지원 음성만)
         if self.options.emotion > 0:
-            params.append(f"emotion={self.options.emotion}")
-            params.append(f"emotion-strength={self.options.emotion_strength}")
-        
-        data = "&".join(params)
+            params["emotion"] = self.options.emotion
+            params["emotion-strength"] = self.options.emotion_strength
         
-        # API 요청
-        request = urllib.request.Request(self.API_URL)
-        request.add_header("X-NCP-APIGW-API-KEY-ID", self.client_id)
-        request.add_header("X-NCP-APIGW-API-KEY", self.client_secret)
-        request.add_header("Content-Type", "application/x-www-form-urlencoded")
+        # 퍼센트 인코딩 후에는 ASCII만 남음
+        data = urllib.parse.urlencode(params).encode('ascii')
         
+        # API 요청 (keep-alive 연결 재사용, 일시적 오류는 간격을 늘려 재시도)
         try:
-            response = urllib.request.urlopen(
-                request, 
-                data=data.encode('utf-8'), 
-                timeout=30
-            )
-            
-            if response.getcode() == 200:
-                # 출력 디렉토리 생성
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            for attempt in range(MAX_RETRIES + 1):
+                response = post_form(self.API_URL, self._headers(), data, timeout=30)
                 
-                with open(output_path, 'wb') as f:
-                    f.write(response.read())
-                return True
-            else:
-                if self.on_error:
-                    self.on_error(f"HTTP {response.getcode()}", output_path)
-                return False
+                if response.status == 200:
+                    # 출력 디렉토리 생성
+                    if make_dirs:
+                        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                    
+                    # 응답 본문을 메모리에 모으지 않고 청크 단위로 기록
+                    try:
+                        with open(output_path, 'wb') as f:
+                            shutil.copyfileobj(response, f, _STREAM_CHUNK_SIZE)
+                    except BaseException:
+                        # 중간에 끊긴 파일이 기존 파일로 보이지 않도록 제거
+                        try:
+                            os.remove(output_path)
+                        except OSError:
+                            pass
+                        raise
+                    return None
+                
+                # 연결 재사용을 위해 오류 응답 본문도 끝까지 읽음
+                response.read()
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return f"HTTP 오류: {response.status} - {response.reason}"
+                time.sleep(RETRY_BACKOFF * (2 ** attempt))
                 
-        except urllib.error.HTTPError as e:
-            if self.on_error:
-                self.on_error(f"HTTP 오류: {e.code} - {e.reason}", output_path)
-            return False
         except Exception as e:
-            if self.on_error:
-                self.on_error(f"오류: {str(e)}", output_path)
-            return False
+            return f"오류: {str(e)}"
+    
+    def _headers(self) -> dict:
+        """API 요청 헤더 (client_id/client_secret 값이 바뀔 때만 다시 생성)"""
+        key = (self.client_id, self.client_secret)
+        if self._headers_key != key:
+            # 다른 스레드가 새 키와 이전 헤더를 함께 보지 않도록 헤더를 먼저 교체
+            self._request_headers = {
+                "X-NCP-APIGW-API-KEY-ID": self.client_id,
+                "X-NCP-APIGW-API-KEY": self.client_secret,
+                "Content-Type": "application/x-www-form-urlencoded",
+            }
+            self._headers_key = key
+        return self._request_headers
     
     def generate_batch(self, items: list, output_folder: str, 
                        filename_generator: Callable) -> dict:
         """배치 TTS 생성
         
+        최대 BATCH_CONCURRENCY개의 요청을 동시에 보내되, 요청 시작 간격은
+        api_delay 이상으로 유지한다. 콜백은 모두 호출한 스레드에서 실행된다.
+        
         Args:
             items: SRTEntry 리스트
             output_folder: 출력 폴더
@@ -137,39 +179,72 @@ class TTSEngine:
         }
         
         total = len(items)
+        done = 0
+        # 입력 순서대로 파일 목록을 만들기 위한 항목별 결과 경로
+        outputs = [None] * total
+        pending = []
+        
+        # 출력 폴더를 한 번만 읽어 기존 파일 크기 확인 (항목별 stat 생략)
+        existing = {}
+        try:
+            with os.scandir(output_folder) as it:
+                for e in it:
+                    if e.is_file():
+                        existing[e.name] = e.stat().st_size
+        except OSError:
+            pass
         
         for i, entry in enumerate(items):
-            # 취소 확인
-            if self._cancel_requested:
-                results['cancelled'] = True
-                break
-            
             filename = filename_generator(entry)
             output_path = os.path.join(output_folder, filename)
             
-            # 이미 존재하는 파일 건너뛰기
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            # 이미 존재하는 파일 건너뛰기 (하위 폴더가 포함된 파일명은 직접 확인)
+            if os.path.dirname(filename):
+                size = os.path.getsize(output_path) if os.path.isfile(output_path) else 0
+            else:
+                size = existing.get(filename, 0)
+            if size > 0:
                 results['success'] += 1
-                results['files'].append(output_path)
+                outputs[i] = output_path
+                done += 1
                 if self.on_progress:
-                    self.on_progress(i + 1, total, f"기존 파일: {filename}")
+                    self.on_progress(done, total, f"기존 파일: {filename}")
                 continue
             
-            # 진행 상황 콜백
-            if self.on_progress:
-                self.on_progress(i + 1, total, f"생성 중: {filename}")
-            
-            # TTS 생성
-            if self.generate_single(entry.text, output_path):
-                results['success'] += 1
-                results['files'].append(output_path)
-            else:
-                results['failed'] += 1
+            pending.append((i, entry.text, output_path, filename))
+        
+        if pending:
+            # 출력 폴더는 요청 전에 한 번만 생성
+            for folder in {os.path.dirname(p[2]) for p in pending}:
+                if folder:
+                    os.makedirs(folder, exist_ok=True)
             
-            # API 호출 간 대기
-            if i < total - 1:
-                time.sleep(self.api_delay)
+            workers = min(self.BATCH_CONCURRENCY, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self._generate_throttled, text, output_path): (i, output_path, filename)
+                    for i, text, output_path, filename in pending
+                }
+                for future in as_completed(futures):
+                    i, output_path, filename = futures[future]
+                    error = future.result()
+                    done += 1
+                    
+                    if error is None:
+                        results['success'] += 1
+                        outputs[i] = output_path
+                        if self.on_progress:
+                            self.on_progress(done, total, f"생성 완료: {filename}")
+                    elif not self._cancel_requested:
+                        results['failed'] += 1
+                        if self.on_error:
+                            self.on_error(error, output_path)
+                        if self.on_progress:
+                            self.on_progress(done, total, f"생성 실패: {filename}")
         
+        # 취소 후 건너뛴 항목은 실패로 세지 않음
+        results['cancelled'] = self._cancel_requested
+        results['files'] = [path for path in outputs if path is not None]
         self._is_running = False
         
         # 완료 콜백
@@ -182,6 +257,14 @@ class TTSEngine:
         
         return results
     
+    def _generate_throttled(self, text: str, output_path: str) -> Optional[str]:
+        """요청 시작 간격을 지키며 TTS 생성 (작업 스레드용)"""
+        self._throttle.wait(self.api_delay)
+        
+        if self._cancel_requested:
+            return "취소됨"
+        return self._request_tts(text, output_path, make_dirs=False)
+    
     def cancel(self):
         """작업 취소 요청"""
         self._cancel_requested = True
@@ -200,34 +283,20 @@ class TTSEngine:
         if not self.client_id or not self.client_secret:
             return False, "API 키가 설정되지 않았습니다."
         
-        # 짧은 테스트 문장
-        test_text = "테스트"
-        enc_text = urllib.parse.quote(test_text)
-        data = f"speaker=nara&text={enc_text}&volume=0&speed=0&pitch=0&format=wav"
-        
-        request = urllib.request.Request(self.API_URL)
-        request.add_header("X-NCP-APIGW-API-KEY-ID", self.client_id)
-        request.add_header("X-NCP-APIGW-API-KEY", self.client_secret)
-        request.add_header("Content-Type", "application/x-www-form-urlencoded")
-        
         try:
-            response = urllib.request.urlopen(
-                request,
-                data=data.encode('utf-8'),
-                timeout=10
-            )
+            # 짧은 테스트 문장
+            response = post_form(self.API_URL, self._headers(), _TEST_BODY, timeout=10)
+            # 연결 재사용을 위해 본문은 끝까지 읽음
+            response.read()
             
-            if response.getcode() == 200:
+            if response.status == 200:
                 return True, "연결 성공"
-            else:
-                return False, f"HTTP {response.getcode()}"
-                
-        except urllib.error.HTTPError as e:
-            if e.code == 401:
+            elif response.status == 401:
                 return False, "인증 실패: API 키를 확인하세요"
-            elif e.code == 429:
+            elif response.status == 429:
                 return False, "요청 한도 초과"
             else:
-                return False, f"HTTP 오류: {e.code}"
+                return False, f"HTTP 오류: {response.status}"
+                
         except Exception as e:
             return False, f"연결 오류: {str(e)}"
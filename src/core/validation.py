@@ -7,6 +7,10 @@ from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
 
+# 음절이 아닌 문자 (공백, 특수문자)
+# 유니코드 \w에 한글 음절이 이미 포함되므로 [^\w가-힣]와 같은 집합
+_NON_SYLLABLE_RE = re.compile(r'\W')
+
 
 @dataclass
 class ValidationResult:
@@ -70,8 +74,7 @@ class Validator:
         - 한글/영문/숫자 글자 수
         """
         # 공백 및 특수문자 제거 (한글, 영문, 숫자만 남김)
-        cleaned = re.sub(r'[^\w가-힣]', '', text)
-        return len(cleaned)
+        return len(_NON_SYLLABLE_RE.sub('', text))
 
     def validate(self,
                  all_underlined_text: str,
@@ -97,4 +97,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 리포트 저장용 자식 프로세스 지원
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -628,13 +628,12 @@ class ScriptConverterTab(QWidget):
         # SRT 저장
         try:
             srt_path = os.path.join(self.output_folder, f"{base_name}.srt")
-            content = self.generator.generate(
-                self.entries,
+            self.generator.save_streaming(
+                self.entries, srt_path,
                 max_chars_per_line=self.spin_chars.value(),
                 break_on_period=self.chk_break_period.isChecked(),
                 remove_brackets=not self.chk_include_brackets.isChecked()
             )
-            self.generator.save(content, srt_path)
             self.last_saved_srt = srt_path
             saved_files.append("SRT")
         except Exception as e:
@@ -774,13 +773,12 @@ class ScriptConverterTab(QWidget):
         
         if filepath:
             try:
-                content = self.generator.generate(
-                    self.entries,
+                self.generator.save_streaming(
+                    self.entries, filepath,
                     max_chars_per_line=self.spin_chars.value(),
                     break_on_period=self.chk_break_period.isChecked(),
                     remove_brackets=not self.chk_include_brackets.isChecked()
                 )
-                self.generator.save(content, filepath)
                 self.last_saved_srt = filepath
                 self.status_message.emit(f"SRT 저장 완료: {os.path.basename(filepath)}")
             except Exception as e:
@@ -802,14 +800,12 @@ class ScriptConverterTab(QWidget):
         temp_dir = tempfile.gettempdir()
         temp_srt = os.path.join(temp_dir, "tomato_ad_temp.srt")
         
-        content = self.generator.generate(
-            self.entries,
+        self.generator.save_streaming(
+            self.entries, temp_srt,
             max_chars_per_line=self.spin_chars.value(),
             break_on_period=self.chk_break_period.isChecked(),
             remove_brackets=not self.chk_include_brackets.isChecked()
         )
-        
-        self.generator.save(content, temp_srt)
         self.srt_ready.emit(temp_srt)
         self.status_message.emit("SRT가 TTS 탭으로 전송되었습니다.")
     
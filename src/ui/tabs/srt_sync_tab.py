@@ -631,13 +631,25 @@ class SRTSyncTab(QWidget):
         default_path = os.path.join(os.path.dirname(self.srt_path), default_name)
         
         filepath, _ = QFileDialog.getSaveFileName(
-            self, "리포트 저장", default_path, "Excel Files (*.xlsx);;Text Files (*.txt)"
+            self, "리포트 저장", default_path, "Excel Files (*.xlsx);;CSV Files (*.csv);;Text Files (*.txt)"
         )
         
         if filepath:
             try:
                 if filepath.endswith('.xlsx'):
-                    self.sync.save_report_xlsx(filepath)
+                    # 별도 프로세스에서 저장 - 완료 시 상태 메시지 표시
+                    name = os.path.basename(filepath)
+                    future = self.sync.save_report_xlsx_async(filepath)
+                    future.add_done_callback(
+                        lambda f: self.status_message.emit(
+                            f"리포트 저장: {name}" if not f.exception() and f.result()
+                            else f"리포트 저장 실패: {name}"
+                        )
+                    )
+                    self.status_message.emit(f"리포트 저장 중: {name}")
+                    return
+                elif filepath.endswith('.csv'):
+                    self.sync.save_report_csv(filepath)
                 else:
                     self.sync.save_report_txt(filepath)
                 
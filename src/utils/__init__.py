@@ -2,6 +2,7 @@
 from .timecode import (
     ms_to_timecode,
     ms_to_filename_tc,
+    ms_to_srt_time,
     ms_to_frames,
     frames_to_ms,
     timecode_to_ms,
@@ -12,6 +13,7 @@ from .audio import (
     get_wav_duration_ms,
     get_wav_info,
     get_wav_sample_rate,
-    is_valid_wav
+    is_valid_wav,
+    read_wav_header
 )
 from .config import config, Config
@@ -3,15 +3,70 @@
 
 import wave
 import os
+import struct
+from typing import Optional, Tuple
+
+# 헤더 파싱을 위해 한 번에 읽는 크기 (fmt/data 청크가 보통 이 안에 있음)
+_HEADER_READ_SIZE = 128
+_WAVE_FORMAT_PCM = 1
+
+
+def _parse_wav_header(buf: bytes) -> Optional[Tuple[int, int, int, int]]:
+    """RIFF 헤더 버퍼에서 (샘플레이트, 채널 수, 비트 수, 프레임 수) 추출
+
+    PCM이 아니거나 data 청크가 버퍼 밖에 있으면 None
+    """
+    if len(buf) < 12 or buf[0:4] != b'RIFF' or buf[8:12] != b'WAVE':
+        return None
+
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(buf):
+        chunk_id, size = struct.unpack_from('<4sI', buf, pos)
+        if chunk_id == b'fmt ':
+            if pos + 24 > len(buf):
+                return None
+            fmt_tag, channels, rate, _, _, bits = struct.unpack_from('<HHIIHH', buf, pos + 8)
+            if fmt_tag != _WAVE_FORMAT_PCM:
+                return None
+            fmt = (rate, channels, bits)
+        elif chunk_id == b'data':
+            if fmt is None:
+                return None
+            rate, channels, bits = fmt
+            frame_size = channels * ((bits + 7) // 8)
+            if frame_size == 0:
+                return None
+            return rate, channels, bits, size // frame_size
+        pos += 8 + size + (size & 1)
+    return None
+
+
+def read_wav_header(wav_path: str) -> Tuple[int, int, int, int]:
+    """WAV 헤더 정보 (샘플레이트, 채널 수, 비트 수, 프레임 수) 반환
+
+    파일 앞부분을 한 번 읽어 fmt/data 청크를 직접 파싱한다.
+    비표준 헤더는 wave 모듈로 처리하며, 읽을 수 없으면 예외가 발생한다.
+    """
+    fd = os.open(wav_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        buf = os.read(fd, _HEADER_READ_SIZE)
+    finally:
+        os.close(fd)
+
+    header = _parse_wav_header(buf)
+    if header is not None:
+        return header
+
+    with wave.open(wav_path, 'r') as w:
+        return w.getframerate(), w.getnchannels(), w.getsampwidth() * 8, w.getnframes()
 
 
 def get_wav_duration_ms(wav_path: str) -> int:
     """WAV 파일 길이(밀리초) 반환"""
     try:
-        with wave.open(wav_path, 'r') as w:
-            frames = w.getnframes()
-            rate = w.getframerate()
-            return int((frames / rate) * 1000)
+        rate, _, _, frames = read_wav_header(wav_path)
+        return int((frames / rate) * 1000)
     except Exception:
         return 0
 
@@ -19,14 +74,14 @@ def get_wav_duration_ms(wav_path: str) -> int:
 def get_wav_info(wav_path: str) -> dict:
     """WAV 파일 정보 반환"""
     try:
-        with wave.open(wav_path, 'r') as w:
-            return {
-                'duration_ms': int((w.getnframes() / w.getframerate()) * 1000),
-                'sample_rate': w.getframerate(),
-                'channels': w.getnchannels(),
-                'sample_width': w.getsampwidth(),
-                'frames': w.getnframes()
-            }
+        rate, channels, bits, frames = read_wav_header(wav_path)
+        return {
+            'duration_ms': int((frames / rate) * 1000),
+            'sample_rate': rate,
+            'channels': channels,
+            'sample_width': (bits + 7) // 8,
+            'frames': frames
+        }
     except Exception:
         return {
             'duration_ms': 0,
@@ -40,20 +95,14 @@ def get_wav_info(wav_path: str) -> dict:
 def get_wav_sample_rate(wav_path: str) -> int:
     """WAV 파일 샘플레이트 반환"""
     try:
-        with wave.open(wav_path, 'r') as w:
-            return w.getframerate()
+        return read_wav_header(wav_path)[0]
     except Exception:
         return 48000
 
 
 def is_valid_wav(wav_path: str) -> bool:
-    """유효한 WAV 파일인지 확인"""
-    if not os.path.exists(wav_path):
-        return False
-    if os.path.getsize(wav_path) == 0:
-        return False
+    """유효한 WAV 파일인지 확인 (없거나 비어 있으면 헤더 읽기에서 실패)"""
     try:
-        with wave.open(wav_path, 'r') as w:
-            return w.getnframes() > 0
+        return read_wav_header(wav_path)[3] > 0
     except Exception:
         return False
@@ -17,6 +17,14 @@ def ms_to_filename_tc(ms: int, fps: float = 24) -> str:
     return tc.replace(':', '_')
 
 
+def ms_to_srt_time(ms: int) -> str:
+    """밀리초를 SRT 시간 형식(HH:MM:SS,mmm)으로 변환"""
+    q, milliseconds = divmod(ms, 1000)
+    q, seconds = divmod(q, 60)
+    hours, minutes = divmod(q, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
 def ms_to_frames(ms: int, fps: float = 24) -> int:
     """밀리초를 프레임 수로 변환"""
     return int((ms / 1000) * fps)